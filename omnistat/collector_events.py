@@ -22,20 +22,17 @@
 # SOFTWARE.
 # -------------------------------------------------------------------------------
 
-import _thread
 import configparser
 import logging
 import sys
+import threading
 import time
 
-from prometheus_client import CollectorRegistry, Gauge, generate_latest
+from prometheus_client import Gauge
 
 from omnistat.collector_base import Collector
 from omnistat.utils import get_amdsmi_module
 
-# Shared amdsmi module
-smi = get_amdsmi_module()
-
 
 class ROCMEvents(Collector):
     def __init__(self, config: configparser.ConfigParser):
@@ -48,8 +45,9 @@ class ROCMEvents(Collector):
 
         logging.debug("Initializing ROCm SMI event collector")
 
-        global smi
+        # Shared amdsmi module (loaded by Monitor prior to collector initialization)
         smi = get_amdsmi_module()
+        self.__smi = smi
         try:
             smi.amdsmi_init()
             logging.debug("AMD SMI library API initialized")
@@ -75,10 +73,20 @@ class ROCMEvents(Collector):
             logging.error(e)
             sys.exit(1)
 
+        self.__GPUmetrics = {}
+        self.__throttle_count = [0] * self.__numGpus
+        self.__throttle_setters = []
+
         # Launch polling threads for event reads (1 per GPU) - polling at 0.1 sec interval
         try:
             for i in range(self.__numGpus):
-                _thread.start_new_thread(self.poll_gpu_events, (self.__events[i], i, 100))
+                thread = threading.Thread(
+                    target=self.poll_gpu_events,
+                    args=(self.__events[i], i, 100),
+                    daemon=True,
+                    name=f"GPU {i} event poller",
+                )
+                thread.start()
             time.sleep(0.25)
 
         except Exception as e:
@@ -87,9 +95,6 @@ class ROCMEvents(Collector):
 
         logging.debug("SMI event collector initialized")
 
-        self.__GPUmetrics = {}
-        self.__throttle_count = []
-
     # --------------------------------------------------------------------------------------
     # Required child methods
 
@@ -100,24 +105,48 @@ class ROCMEvents(Collector):
         self.__GPUmetrics["throttle_events"] = Gauge(metricName, "# of throttling events detected", labelnames=["card"])
         logging.info("--> [registered] %s (gauge)" % metricName)
         for gpu in range(self.__numGpus):
-            self.__GPUmetrics["throttle_events"].labels(card=gpu).set(0)
-            self.__throttle_count.append(0)
+            setter = self.__GPUmetrics["throttle_events"].labels(card=gpu).set
+            setter(0)
+            self.__throttle_setters.append(setter)
         return
 
     def updateMetrics(self):
         """Update registered metrics of interest"""
-        for gpu in range(self.__numGpus):
-            self.__GPUmetrics["throttle_events"].labels(card=gpu).set(self.__throttle_count[gpu])
+        for gpu, setter in enumerate(self.__throttle_setters):
+            setter(self.__throttle_count[gpu])
         return
 
     # --------------------------------------------------------------------------------------
     # Additional custom methods unique to this collector
 
     def poll_gpu_events(self, event, gpu_index, timeout_msec):
-        while 1:
+        """Background thread to accumulate throttle events for a single GPU.
+
+        Args:
+            event (AmdSmiEventReader): Event reader for the GPU.
+            gpu_index (int): Index of the GPU.
+            timeout_msec (int): Maximum time to wait for new events in each read.
+        """
+        error_backoff_secs = 0.05
+        error_log_interval_secs = 60.0
+        last_error_log = None
+
+        # Accumulate locally and publish with a single store: each slot of
+        # __throttle_count has exactly one writer, so no read-modify-write is
+        # shared with the scrape thread.
+        count = self.__throttle_count[gpu_index]
+
+        while True:
             try:
                 newevents = event.read(timeout_msec)
-                self.__throttle_count[gpu_index] += len(newevents)
-            except:
-                pass
-        return
+            except self.__smi.AmdSmiException as e:
+                # Back off to avoid spinning on persistent errors and rate-limit logging
+                now = time.monotonic()
+                if last_error_log is None or now - last_error_log >= error_log_interval_secs:
+                    logging.debug("Unable to read events for GPU %i: %s" % (gpu_index, e))
+                    last_error_log = now
+                time.sleep(error_backoff_secs)
+                continue
+            if newevents:
+                count += len(newevents)
+                self.__throttle_count[gpu_index] = count
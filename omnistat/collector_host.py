@@ -42,7 +42,10 @@ omnistat_host_cpu_num_physical_cores 128.0
 omnistat_host_cpu_num_logical_cores 128.0
 """
 
+import concurrent.futures
 import configparser
+import functools
+import glob
 import logging
 import os
 import re
@@ -56,6 +59,99 @@ from prometheus_client import Counter, Gauge
 import omnistat.utils as utils
 from omnistat.collector_base import Collector
 
+# rchar/wchar are the first two entries of /proc/<pid>/io
+PROC_IO_PATTERN = re.compile(rb"rchar:\s*(\d+)\nwchar:\s*(\d+)")
+
+# /proc/diskstats lines with at least 14 fields: captures device name (field 3),
+# sectors read (field 6) and sectors written (field 10)
+DISKSTATS_PATTERN = re.compile(
+    rb"^[ \t]*\d+[ \t]+\d+[ \t]+(\S+)[ \t]+\d+[ \t]+\d+[ \t]+(\d+)(?:[ \t]+\d+){3}[ \t]+(\d+)(?:[ \t]+\d+){4}",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def cpu_counts():
+    """Determine physical core count and logical CPU count (cached for process lifetime).
+
+    Physical cores are counted as the number of unique thread sibling sets
+    reported via sysfs topology (one read per logical CPU).
+
+    Returns:
+        int: (physical_cores, logical_cores)
+    """
+    # Logical CPUs
+    logical = os.cpu_count() or 0
+
+    # Physical cores determined via sysfs topology
+    try:
+        sibling_sets = set()
+        for path in glob.glob("/sys/devices/system/cpu/cpu[0-9]*/topology/thread_siblings_list"):
+            try:
+                with open(path, "r") as f:
+                    sibling_sets.add(f.read().strip())
+            except (FileNotFoundError, PermissionError):
+                continue
+        physical = len(sibling_sets) if sibling_sets else logical
+    except Exception:
+        physical = logical
+
+    return (physical, logical)
+
+
+def list_proc_pids(dir_fd):
+    """List processes present in an open /proc directory.
+
+    Args:
+        dir_fd (int): File descriptor of the open /proc directory.
+
+    Returns:
+        dict: {pid: directory_name}
+    """
+    with os.scandir(dir_fd) as it:
+        return {
+            int(entry.name): entry.name for entry in it if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)
+        }
+
+
+def pread_all(fd, chunk_size=65536):
+    """Read the full contents of a procfs file via an open file descriptor.
+
+    Args:
+        fd (int): Open file descriptor.
+        chunk_size (int): Number of bytes to request per read.
+
+    Returns:
+        bytes: File contents.
+    """
+    chunks = []
+    offset = 0
+    while True:
+        data = os.pread(fd, chunk_size, offset)
+        if not data:
+            break
+        chunks.append(data)
+        offset += len(data)
+    return b"".join(chunks)
+
+
+def read_proc_file(dir_fd, path, nbytes=512):
+    """Read raw contents of a small procfs file relative to an open directory.
+
+    Args:
+        dir_fd (int): File descriptor of an open directory (e.g. /proc).
+        path (str): Path of the file relative to dir_fd.
+        nbytes (int): Maximum number of bytes to read.
+
+    Returns:
+        bytes: File contents (up to nbytes).
+    """
+    fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+    try:
+        return os.read(fd, nbytes)
+    finally:
+        os.close(fd)
+
 
 class HOST(Collector):
     def __init__(self, config: configparser.ConfigParser):
@@ -70,14 +166,14 @@ class HOST(Collector):
         self.__metrics = {}
 
         # CPU sampling thread state
-        self.__cpu_lock = threading.Lock()
-        self.__cpu_delta_idle = 0
-        self.__cpu_delta_total = 0
-        self.__sampler_running = False
+        # (delta_idle, delta_total) published by the sampler as a single tuple
+        # so readers always see a consistent pair without locking
+        self.__cpu_deltas = (0, 0)
         self.__sampler_thread = None
         self.__cpu_load_sampling_interval = 0.05
         self.__enable_proc_io_stats = False
         self.__proc_io_cmds_exclude = ["flux-"]
+        self.__proc_io_num_threads = min(4, os.cpu_count() or 1)
 
         # runtime config parsing
         if config.has_section("omnistat.collectors.host"):
@@ -92,6 +188,11 @@ class HOST(Collector):
                     self.__proc_io_cmds_exclude = config["omnistat.collectors.host"].get("proc_io_cmds_exclude")
                     self.__proc_io_cmds_exclude = re.split(r",\s*", self.__proc_io_cmds_exclude)
                     logging.debug("--> overriding default proc_io_cmd_exclude_list...")
+                if config.has_option("omnistat.collectors.host", "proc_io_num_threads"):
+                    self.__proc_io_num_threads = max(
+                        1, config["omnistat.collectors.host"].getint("proc_io_num_threads")
+                    )
+                    logging.debug("--> overriding default proc_io_num_threads...")
 
     def registerMetrics(self):
         """Register metrics of interest"""
@@ -101,6 +202,7 @@ class HOST(Collector):
         logging.info("enable_proc_io_stats: %s" % str(self.__enable_proc_io_stats))
         if self.__enable_proc_io_stats:
             logging.info("proc_io_cmds_exclude: %s" % self.__proc_io_cmds_exclude)
+            logging.info("proc_io_num_threads: %i" % self.__proc_io_num_threads)
 
         # --
         # Memory oriented metrics
@@ -113,7 +215,6 @@ class HOST(Collector):
             {"entry":"MemAvailable","index":2,"metricName":"mem_available_bytes","description":"Available memory on the host in bytes"},
         ]
         # fmt: on
-        self.__max_mem_metric_index = max(item["index"] for item in self.__mem_metrics)
 
         # verify /proc/meminfo exists
         if not os.path.exists("/proc/meminfo"):
@@ -121,16 +222,25 @@ class HOST(Collector):
             sys.exit(4)
             return
 
-        # verify metric ordering expectations
-        with open("/proc/meminfo", "r") as f:
-            for item in self.__mem_metrics:
-                line = f.readline()
-                # Check if the memory entry matches expected
-                if not line.startswith(item["entry"] + ":"):
-                    logging.error(f"--> [ERROR] Expected {item['entry']} in /proc/meminfo but found: {line.strip()}")
-                    sys.exit(4)
-                else:
-                    logging.debug(f"--> verified {item['entry']} in /proc/meminfo")
+        # Keep /proc/meminfo open and match all leading entries of interest in one pass
+        entries = sorted(self.__mem_metrics, key=lambda item: item["index"])
+        self.__meminfo_pattern = re.compile(
+            rb"\n".join(rb"%s:\s+(\d+) kB" % item["entry"].encode() for item in entries)
+        )
+        self.__meminfo_fd = os.open("/proc/meminfo", os.O_RDONLY)
+        self.__meminfo_buf = bytearray(512)
+
+        # verify metric ordering expectations (single read of the leading entries)
+        lines = os.pread(self.__meminfo_fd, len(self.__meminfo_buf), 0).split(b"\n")
+        for item, line in zip(entries, lines):
+            # Check if the memory entry matches expected
+            if not line.startswith(item["entry"].encode() + b":"):
+                logging.error(
+                    f"--> [ERROR] Expected {item['entry']} in /proc/meminfo but found: {line.decode().strip()}"
+                )
+                sys.exit(4)
+            else:
+                logging.debug(f"--> verified {item['entry']} in /proc/meminfo")
 
         for item in self.__mem_metrics:
             metric = item["metricName"]
@@ -138,6 +248,9 @@ class HOST(Collector):
             self.__metrics[metric] = Gauge(self.__prefix + metric, description)
             logging.info("--> [registered] %s (gauge)" % (self.__prefix + metric))
 
+        # (index, setter) pairs used to update memory metrics at each scrape
+        self.__mem_setters = [(item["index"], self.__metrics[item["metricName"]].set) for item in self.__mem_metrics]
+
         # --
         # I/O oriented metrics
         # --
@@ -212,6 +325,8 @@ class HOST(Collector):
             logging.error(f"--> [ERROR] Unexpected entry in /proc/stat: {first.strip()}")
             sys.exit(4)
 
+        self.__loadavg_fd = os.open("/proc/loadavg", os.O_RDONLY)
+
         for item in self.__loadavg_metrics:
             metric = item["metricName"]
             description = item["description"]
@@ -244,6 +359,14 @@ class HOST(Collector):
                     break
         self.__metrics["boot_time_seconds"].set(boot_time)
 
+        # Direct references to gauges updated at every scrape
+        self.__io_read_local_gauge = self.__metrics["io_read_local_total_bytes"]
+        self.__io_write_local_gauge = self.__metrics["io_write_local_total_bytes"]
+        self.__io_read_gauge = self.__metrics.get("io_read_total_bytes")
+        self.__io_write_gauge = self.__metrics.get("io_write_total_bytes")
+        self.__cpu_load1_gauge = self.__metrics["cpu_load1"]
+        self.__cpu_utilization_gauge = self.__metrics["cpu_aggregate_core_utilization"]
+
         # Check for elevated /proc access: if we can read /proc/1/io, assume we have elevated read access
         # and will explicitly filter out root-owned processes when aggregating per-process I/O (typically in system-mode).
         # Otherwise we just report on user-owned processes (user-mode)
@@ -257,14 +380,27 @@ class HOST(Collector):
             self.__filter_root_processes = False
             logging.debug("--> non-root /proc access detected")
 
+        # Keep /proc open to resolve per-process files relative to it
+        self.__proc_fd = None
+        self.__proc_io_pool = None
+        if self.__enable_proc_io_stats:
+            self.__proc_fd = os.open("/proc", os.O_RDONLY | os.O_DIRECTORY)
+            if self.__proc_io_num_threads > 1:
+                self.__proc_io_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.__proc_io_num_threads, thread_name_prefix="proc I/O reader"
+                )
+
         # Cache current UID
         try:
             self.__current_uid = os.geteuid()
         except AttributeError:
             self.__current_uid = None
 
+        # Keep /proc/stat and /proc/diskstats open for periodic sampling
+        self.__stat_fd = os.open("/proc/stat", os.O_RDONLY)
+        self.__diskstats_fd = os.open("/proc/diskstats", os.O_RDONLY)
+
         # Initiate background CPU sampler thread
-        self.__sampler_running = True
         self.__sampler_thread = threading.Thread(
             target=self.cpu_load_sampler,
             args=(self.__cpu_load_sampling_interval,),
@@ -278,6 +414,7 @@ class HOST(Collector):
 
         # Initialize disk device tracking for local I/O stats
         self.__tracked_devices = self.init_read_local_disk_io()
+        self.__tracked_device_names = {name.encode() for name in self.__tracked_devices}
         if self.__tracked_devices:
             logging.info(
                 f"--> tracking {len(self.__tracked_devices)} local disk device(s): {sorted(self.__tracked_devices)}"
@@ -292,65 +429,63 @@ class HOST(Collector):
         # Memory oriented metrics
         # --
 
-        mem_info = self.read_meminfo(self.__max_mem_metric_index + 1)
+        mem_info = self.read_meminfo()
 
-        for item in self.__mem_metrics:
-            metric = item["metricName"]
-            index = item["index"]
-            if metric in self.__metrics and index < len(mem_info):
-                self.__metrics[metric].set(mem_info[index])
+        for index, setter in self.__mem_setters:
+            if index < len(mem_info):
+                setter(mem_info[index])
 
         # --
         # I/O oriented metrics
         # --
 
         read_total_local, write_total_local = self.read_local_disk_io()
-        self.__metrics["io_read_local_total_bytes"].set(read_total_local)
-        self.__metrics["io_write_local_total_bytes"].set(write_total_local)
+        self.__io_read_local_gauge.set(read_total_local)
+        self.__io_write_local_gauge.set(write_total_local)
 
         if self.__enable_proc_io_stats:
-            self.__metrics["io_read_total_bytes"].clear()
-            self.__metrics["io_write_total_bytes"].clear()
+            self.__io_read_gauge.clear()
+            self.__io_write_gauge.clear()
 
             # log per-pid process I/O metrics
             reads, writes = self.read_user_proc_io()
             for pid in reads:
-                self.__metrics["io_read_total_bytes"].labels(pid=pid, cmd=reads[pid][1]).set(reads[pid][0])
+                self.__io_read_gauge.labels(pid=pid, cmd=reads[pid][1]).set(reads[pid][0])
             for pid in writes:
-                self.__metrics["io_write_total_bytes"].labels(pid=pid, cmd=writes[pid][1]).set(writes[pid][0])
+                self.__io_write_gauge.labels(pid=pid, cmd=writes[pid][1]).set(writes[pid][0])
 
         # --
         # CPU/load metrics
         # --
 
-        self.__metrics["cpu_load1"].set(self.read_loadavg())
+        load1 = self.read_loadavg()
+        if load1 is not None:
+            self.__cpu_load1_gauge.set(load1)
 
         # Instantaneous CPU usage via background sampler
         delta_idle, delta_total = self.read_cpu_stats()
         if delta_total > 0 and delta_idle >= 0:
             busy = delta_total - delta_idle
-            usage_ratio = busy / delta_total
             # Scale by number of logical cores to get a number of busy cores metric
-            busy_cores = usage_ratio * self.__logical_cpu_count
-            self.__metrics["cpu_aggregate_core_utilization"].set(round(busy_cores, 4))
+            # (integer product first so only one float division is needed)
+            busy_cores = busy * self.__logical_cpu_count / delta_total
+            self.__cpu_utilization_gauge.set(round(busy_cores, 4))
 
         return
 
-    def read_meminfo(self, num_lines):
-        """Read and parse the top num_lines of /proc/meminfo
-        Args:
-            num_lines (int): Number of lines to read from /proc/meminfo
+    def read_meminfo(self):
+        """Read and parse the leading entries of /proc/meminfo
 
         Returns:
-            list: List of memory values in bytes corresponding to the requested lines."""
+            list: List of memory values in bytes corresponding to the registered entries."""
         mem_info = []
 
         try:
-            with open("/proc/meminfo", "r") as f:
-                for _ in range(num_lines):
-                    line = f.readline()
-                    value = line.split()[1]
-                    mem_info.append(int(value) * 1024)  # Convert kB to bytes
+            nbytes = os.preadv(self.__meminfo_fd, [self.__meminfo_buf], 0)
+            match = self.__meminfo_pattern.match(self.__meminfo_buf, 0, nbytes)
+            if match is None:
+                raise ValueError("unexpected format")
+            mem_info = [int(value) * 1024 for value in match.groups()]  # Convert kB to bytes
 
         except Exception as e:
             logging.warning(f"Failed reading /proc/meminfo: {e}")
@@ -370,66 +505,96 @@ class HOST(Collector):
         read_rchar = {}
         write_wchar = {}
 
+        # /proc is re-enumerated every scrape: each tracked process has its io
+        # file read regardless, and (unlike netlink proc connector events) a
+        # directory scan works without CAP_NET_ADMIN in user-mode.
         try:
-            proc_entries = os.listdir("/proc")
-        except:
+            proc_pids = list_proc_pids(self.__proc_fd)
+        except OSError:
             return {}, {}
 
-        for entry in proc_entries:
-            if not entry.isdigit():
-                continue
-            pid = int(entry)
+        # Split processes into contiguous chunks across reader threads (if enabled)
+        entries = list(proc_pids.items())
+        if self.__proc_io_pool is None:
+            results = [self.read_proc_io_entries(entries)]
+        else:
+            chunk_size = max(1, -(-len(entries) // self.__proc_io_num_threads))
+            chunks = [entries[i : i + chunk_size] for i in range(0, len(entries), chunk_size)]
+            results = self.__proc_io_pool.map(self.read_proc_io_entries, chunks)
 
-            proc_dir = f"/proc/{pid}"
-            try:
-                # Skip threads - only track main process
-                try:
-                    os.stat(f"{proc_dir}/task/{pid}")
-                except:
-                    continue
+        for reads, writes in results:
+            read_rchar.update(reads)
+            write_wchar.update(writes)
 
-                # Permission checks
-                stat_info = os.stat(proc_dir)
-                proc_uid = stat_info.st_uid
+        return read_rchar, write_wchar
 
-                if self.__filter_root_processes:
-                    if proc_uid == 0:
-                        continue
-                else:
-                    if self.__current_uid is not None and proc_uid != self.__current_uid:
-                        continue
+    def read_proc_io_entries(self, entries):
+        """Read rchar and wchar for a subset of processes.
 
-                # Ignore commands in exclude list
-                try:
-                    with open(f"{proc_dir}/comm", "r") as f:
-                        command = f.readline().strip()
-                except:
+        Args:
+            entries (list): List of (pid, directory_name) tuples from /proc.
+
+        Returns:
+            dict: {pid: [read_rchar_bytes, command_name]}
+            dict: {pid: [write_wchar_bytes, command_name]}
+        """
+        read_rchar = {}
+        write_wchar = {}
+
+        for pid, entry in entries:
+            try:
+                stat_info = os.stat(entry, dir_fd=self.__proc_fd)
+                if not self.is_proc_owner_tracked(stat_info.st_uid):
                     continue
 
+                # Ignore commands in exclude list
+                command = read_proc_file(self.__proc_fd, f"{entry}/comm").decode().strip()
                 if any(command.startswith(prefix) for prefix in self.__proc_io_cmds_exclude):
                     continue
 
-                # Read I/O stats
-                with open(f"{proc_dir}/io", "r") as f:
-                    rchar_line = f.readline()  # Line 1: rchar: <value>
-                    wchar_line = f.readline()  # Line 2: wchar: <value>
+                # Read I/O stats (Line 1: rchar: <value>, Line 2: wchar: <value>)
+                match = PROC_IO_PATTERN.match(read_proc_file(self.__proc_fd, f"{entry}/io"))
+                if match is None:
+                    continue
 
-                read_rchar[pid] = [int(rchar_line.split(":", 1)[1]), command]
-                write_wchar[pid] = [int(wchar_line.split(":", 1)[1]), command]
+                rchar, wchar = match.groups()
+                read_rchar[pid] = [int(rchar), command]
+                write_wchar[pid] = [int(wchar), command]
 
-            except:
-                # Process disappeared or permission denied
+            except (OSError, ValueError):
+                # Process disappeared, permission denied, or unexpected contents
                 continue
 
         return read_rchar, write_wchar
 
+    def is_proc_owner_tracked(self, proc_uid):
+        """Determine whether processes of a given owner are tracked for per-process I/O.
+
+        Args:
+            proc_uid (int): Owner of the process.
+
+        Returns:
+            bool: True if the process should be tracked.
+        """
+        # Permission checks (threads are never listed in /proc, so only main
+        # processes reach this point)
+        if self.__filter_root_processes:
+            if proc_uid == 0:
+                return False
+        else:
+            if self.__current_uid is not None and proc_uid != self.__current_uid:
+                return False
+
+        return True
+
     def init_read_local_disk_io(self):
         """Initialize tracking of local disk devices.
 
         Reads /proc/diskstats once to identify devices to track, applying filters to:
         1. Skip virtual/pseudo devices (loop, ram, dm-, md, sr, zram)
-        2. Skip likely partitions to avoid overcounting (e.g., nvme0n1 vs nvme0)
-          a. Filter out partitions (devices whose names are prefixed by another device)
+        2. Skip partitions to avoid overcounting (e.g., nvme0n1p1 vs nvme0n1)
+          a. Filter out partitions (devices not listed in /sys/block, or whose names are
+             prefixed by another device if sysfs is unavailable)
           b. Deduplicate devices with identical read/write stats (keeping shortest name)
 
         Returns:
@@ -455,10 +620,21 @@ class HOST(Collector):
                     sectors_written = int(parts[9])
                     devices[dev_name] = (sectors_read, sectors_written)
 
-            # Filter out partitions
+            # Filter out partitions: whole disks are listed in /sys/block (with "/" in
+            # names encoded as "!"), fall back to name prefix matching if unavailable
+            try:
+                block_devices = {name.replace("!", "/") for name in os.listdir("/sys/block")}
+            except OSError:
+                block_devices = None
+
             whole_devices = set()
             for dev_name in devices:
-                is_partition = any(other_name != dev_name and dev_name.startswith(other_name) for other_name in devices)
+                if block_devices is not None:
+                    is_partition = dev_name not in block_devices
+                else:
+                    is_partition = any(
+                        other_name != dev_name and dev_name.startswith(other_name) for other_name in devices
+                    )
                 if not is_partition:
                     whole_devices.add(dev_name)
 
@@ -491,22 +667,11 @@ class HOST(Collector):
         write_bytes = 0
 
         try:
-            with open("/proc/diskstats", "r") as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) < 14:
-                        continue
-
-                    dev_name = parts[2]
-                    if dev_name not in self.__tracked_devices:
-                        continue
-
-                    # parts[5] is sectors read, parts[9] is sectors written
-                    # /proc/diskstats always reports in 512-byte sectors
-                    sectors_read = int(parts[5])
-                    sectors_written = int(parts[9])
-                    read_bytes += sectors_read * 512
-                    write_bytes += sectors_written * 512
+            # /proc/diskstats always reports in 512-byte sectors
+            for dev_name, sectors_read, sectors_written in DISKSTATS_PATTERN.findall(pread_all(self.__diskstats_fd)):
+                if dev_name in self.__tracked_device_names:
+                    read_bytes += int(sectors_read) * 512
+                    write_bytes += int(sectors_written) * 512
 
         except Exception as e:
             return (0, 0)
@@ -517,13 +682,11 @@ class HOST(Collector):
         """Read /proc/loadavg and return the 1 minute load average.
 
         Returns:
-            int: load1
+            float: load1
         """
         try:
-            with open("/proc/loadavg", "r") as f:
-                content = f.read().strip()
-            parts = content.split()
-            return parts[0]
+            data = os.pread(self.__loadavg_fd, 96, 0)
+            return float(data[: data.index(b" ")])
         except Exception as e:
             logging.debug(f"Failed reading /proc/loadavg: {e}")
         return None
@@ -534,30 +697,7 @@ class HOST(Collector):
         Returns:
             int: (physical_cores, logical_cores)
         """
-        # Logical CPUs
-        logical = os.cpu_count() or 0
-
-        # Physical cores determined via sysfs topology
-        physical = 0
-        try:
-            core_pairs = set()
-            base = "/sys/devices/system/cpu"
-            for entry in os.listdir(base):
-                if entry.startswith("cpu") and entry[3:].isdigit():
-                    topo_dir = os.path.join(base, entry, "topology")
-                    try:
-                        with open(os.path.join(topo_dir, "core_id"), "r") as f:
-                            core_id = f.read().strip()
-                        with open(os.path.join(topo_dir, "physical_package_id"), "r") as f:
-                            pkg_id = f.read().strip()
-                        core_pairs.add((pkg_id, core_id))
-                    except (FileNotFoundError, PermissionError):
-                        continue
-            physical = len(core_pairs) if core_pairs else logical
-        except Exception:
-            physical = logical
-
-        return (physical, logical)
+        return cpu_counts()
 
     def read_cpu_stats(self):
         """Return cached CPU stats from background sampling thread.
@@ -565,8 +705,7 @@ class HOST(Collector):
         Returns:
             int: (change_in_idle_cpu_jiffies, change_in_total_cpu_jiffies)
         """
-        with self.__cpu_lock:
-            return (self.__cpu_delta_idle, self.__cpu_delta_total)
+        return self.__cpu_deltas
 
     def cpu_load_sampler(self, sample_interval: float):
         """Background thread to sample /proc/stat CPU times at regular intervals.
@@ -577,15 +716,21 @@ class HOST(Collector):
 
         # Prime with first sample
         prev_idle, prev_total = self.sample_cpu_stats()
-
-        # Sampling loop
-        while self.__sampler_running:
-            time.sleep(sample_interval)
+        next_sample = time.monotonic()
+
+        # Sampling loop: wait until absolute deadlines so the sampling period does
+        # not drift with the time spent sampling
+        while True:
+            next_sample += sample_interval
+            delay = next_sample - time.monotonic()
+            if delay < 0:
+                # fell behind (e.g. host suspended) - resynchronize
+                next_sample = time.monotonic()
+                delay = 0
+            time.sleep(delay)
 
             current_idle, current_total = self.sample_cpu_stats()
-            with self.__cpu_lock:
-                self.__cpu_delta_idle = current_idle - prev_idle
-                self.__cpu_delta_total = current_total - prev_total
+            self.__cpu_deltas = (current_idle - prev_idle, current_total - prev_total)
             prev_idle, prev_total = current_idle, current_total
 
     def sample_cpu_stats(self):
@@ -598,8 +743,8 @@ class HOST(Collector):
         # Note: see https://www.kernel.org/doc/html/latest/filesystems/proc.html for /proc/stat format
         # First 8 entries we care about are: user, nice, system, idle, iowait, irq, softirq, steal
         try:
-            with open("/proc/stat", "r") as f:
-                first_line = f.readline()
+            data = os.pread(self.__stat_fd, 512, 0)
+            first_line = data[: data.index(b"\n")]
             values = [int(v) for v in first_line.split()[1:]]
             idle = values[3] + values[4]  # idle + iowait
             total = sum(values[:8])  # user..steal
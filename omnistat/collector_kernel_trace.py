@@ -26,7 +26,7 @@ import configparser
 import logging
 import threading
 import time
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 
 import orjson
 from flask import Flask, request
@@ -54,8 +54,9 @@ class KernelTrace(EndpointCollector):
         # Buffer to accumulate time series data before pushing it to the
         # database. This buffer is necessary for two different scenarios: 1)
         # to handle long-running kernels, and 2) to handle applications or
-        # sections with a low rate of kernel dispatches.
-        self.__ts = OrderedDict()
+        # sections with a low rate of kernel dispatches. Bins are always
+        # inserted in increasing order, so insertion order is time order.
+        self.__ts = {}
 
         # Initialize time series window buffer
         time_ms = time.time_ns() // 1_000_000
@@ -77,6 +78,10 @@ class KernelTrace(EndpointCollector):
         # strings which can be 600+ byte strings.
         self.__kernel_names = {}
 
+        # Formatted card/kernel label strings, built once per (gpu_id,
+        # kernel_name) key and reused across bins.
+        self.__labels = {}
+
         route("/kernel_trace", methods=["POST"])(self.handleRequest)
 
     def handleRequest(self):
@@ -113,22 +118,24 @@ class KernelTrace(EndpointCollector):
         return self.__format_bins(bins, label_defaults)
 
     def __pop_bins(self, cutoff_bin):
-        num_pop = 0
+        pop_bins = []
         for interval_bin in self.__ts:
             if interval_bin > cutoff_bin:
                 break
-            num_pop += 1
-        bins = []
-        for _ in range(num_pop):
-            bins.append(self.__ts.popitem(last=False))
-        return bins
+            pop_bins.append(interval_bin)
+        return [(interval_bin, self.__ts.pop(interval_bin)) for interval_bin in pop_bins]
 
     def __format_bins(self, bins, label_defaults):
+        labels = self.__labels
         for interval_bin, kernels in bins:
-            for (gpu_id, name), value in kernels.items():
-                yield f'omnistat_kernel_dispatch_count{{{label_defaults},card="{gpu_id}",kernel="{name}"}} {value[0]} {interval_bin}'.encode()
+            for key, value in kernels.items():
+                label = labels.get(key)
+                if label is None:
+                    label = 'card="%s",kernel="%s"' % key
+                    labels[key] = label
+                yield f"omnistat_kernel_dispatch_count{{{label_defaults},{label}}} {value[0]} {interval_bin}".encode()
                 yield b"\n"
-                yield f'omnistat_kernel_total_duration_ns{{{label_defaults},card="{gpu_id}",kernel="{name}"}} {value[1]} {interval_bin}'.encode()
+                yield f"omnistat_kernel_total_duration_ns{{{label_defaults},{label}}} {value[1]} {interval_bin}".encode()
                 yield b"\n"
             yield f"omnistat_kernel_dropped_dispatches{{{label_defaults}}} {self.__dropped_dispatches} {interval_bin}".encode()
             yield b"\n"
@@ -152,7 +159,6 @@ class KernelTrace(EndpointCollector):
         Returns:
             int: The last (most recent) bin in the time series (in ms).
         """
-        dispatches = []
 
         time_ms = time.time_ns() // 1_000_000
         current_bin = ((time_ms // self.__interval_ms) + 1) * self.__interval_ms
@@ -165,28 +171,48 @@ class KernelTrace(EndpointCollector):
         last_bin = next(reversed(self.__ts))
 
         # Keep in-order dictionary of time series intervals
-        for i in range(last_bin + self.__interval_ms, current_bin + 1, self.__interval_ms):
-            self.__ts[i] = {}
-            last_bin = i
-
-        if len(self.__dispatches) > 0:
-            with self.__dispatches_lock:
-                dispatches = self.__dispatches
-                self.__dispatches = []
+        new_bins = range(last_bin + self.__interval_ms, current_bin + 1, self.__interval_ms)
+        if new_bins:
+            self.__ts.update({i: {} for i in new_bins})
+            last_bin = new_bins[-1]
+
+        with self.__dispatches_lock:
+            dispatches = self.__dispatches
+            self.__dispatches = []
+
+        # Consecutive dispatches of the same kernel usually land in the same
+        # bin, so only snapshot the running totals when the (bin, key) run
+        # changes. The snapshot still reflects the last dispatch of each run.
+        run_bin = None
+        run_key = None
+        run_value = None
+
+        interval_ms = self.__interval_ms
+        offset_ns = self.__offset_ns
+        ts = self.__ts
+        values = self.__values
 
         for gpu_id, name, end_ns, duration_ns in dispatches:
-            end_ms = (end_ns + self.__offset_ns) // 1_000_000
-            end_bin = ((end_ms // self.__interval_ms) * self.__interval_ms) + self.__interval_ms
+            end_ms = (end_ns + offset_ns) // 1_000_000
+            end_bin = ((end_ms // interval_ms) * interval_ms) + interval_ms
 
             if end_bin < first_bin or end_bin > last_bin:
-                logging.info(f"Ignore out of range dispatch of kernel {name} = {end_bin}")
+                logging.debug("Ignore out of range dispatch of kernel %s = %d", name, end_bin)
                 self.__dropped_dispatches += 1
                 continue
 
             key = (gpu_id, name)
-            value = self.__values[key]
-            value[0] += 1
-            value[1] += duration_ns
-            self.__ts[end_bin][key] = value[:]
+            if end_bin != run_bin or key != run_key:
+                if run_value is not None:
+                    ts[run_bin][run_key] = run_value[:]
+                run_bin = end_bin
+                run_key = key
+                run_value = values[key]
+
+            run_value[0] += 1
+            run_value[1] += duration_ns
+
+        if run_value is not None:
+            ts[run_bin][run_key] = run_value[:]
 
         return last_bin
@@ -29,12 +29,12 @@ exposed under /sys/class/net and /sys/class/cxi.
 """
 
 import configparser
+import glob
 import logging
 import os
 import platform
-import re
+import stat
 import sys
-from pathlib import Path
 
 from prometheus_client import Gauge
 
@@ -66,102 +66,131 @@ class NETWORK(Collector):
         self.__ib_rx_data_paths = {}
         self.__ib_tx_data_paths = {}
 
+        # Prometheus metrics, only registered if there are counters to export.
+        self.__rx_metric = None
+        self.__tx_metric = None
+
+        # Labelled metric children resolved during registration.
+        self.__net_counters = []
+        self.__cxi_counters = []
+        self.__ib_counters = []
+
+    @staticmethod
+    def __is_nonempty_file(path: str) -> bool:
+        """Check for a non-empty regular file with a single stat call."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and st.st_size > 0
+
     def registerMetrics(self):
         """Register metrics of interest"""
 
-        # Standard IP (/sys/class/net): store data paths to sysfs
-        # statistics files for local NICs, indexed by interface ID. For
+        # Standard IP (/sys/class/net): store open counters for sysfs
+        # statistics files of local NICs, indexed by interface ID. For
         # example, for Rx bandwidth:
         #   __net_rx_data_paths = {
-        #       "eth0": "/sys/class/net/eth0/statistics/rx_bytes"
+        #       "eth0": <counter for /sys/class/net/eth0/statistics/rx_bytes>
         #   }
-        for nic in Path("/sys/class/net").iterdir():
-            if not nic.is_dir():
-                continue
+        with os.scandir("/sys/class/net") as entries:
+            net_nics = [entry for entry in entries if entry.is_dir()]
 
-            nic_name = nic.name
+        for nic_entry in net_nics:
+            nic = nic_entry.path
+            nic_name = nic_entry.name
             if nic_name == "lo":
                 continue
 
-            rx_path = nic / "statistics/rx_bytes"
-            if rx_path.is_file() and rx_path.stat().st_size > 0:
-                self.__net_rx_data_paths[nic_name] = rx_path
-
-            tx_path = nic / "statistics/tx_bytes"
-            if tx_path.is_file() and tx_path.stat().st_size > 0:
-                self.__net_tx_data_paths[nic_name] = tx_path
-
-        # Slingshot CXI traffic (/sys/class/cxi): store data paths to binned
-        # telemetry files, indexed by interface ID and minimum size of the
-        # bucket. For example, for Rx bandwidth:
+            rx_path = os.path.join(nic, "statistics", "rx_bytes")
+            if self.__is_nonempty_file(rx_path):
+                rx_counter = utils.open_sysfs_counter(rx_path)
+                if rx_counter is not None:
+                    self.__net_rx_data_paths[nic_name] = rx_counter
+
+            tx_path = os.path.join(nic, "statistics", "tx_bytes")
+            if self.__is_nonempty_file(tx_path):
+                tx_counter = utils.open_sysfs_counter(tx_path)
+                if tx_counter is not None:
+                    self.__net_tx_data_paths[nic_name] = tx_counter
+
+        # Slingshot CXI traffic (/sys/class/cxi): store open counters for
+        # binned telemetry files, indexed by interface ID and minimum size of
+        # the bucket. For example, for Rx bandwidth:
         #   __cxi_rx_data_paths = {
         #       "cxi0": {
-        #           27: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_27",
-        #           35: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_35",
-        #           36: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_36_to_63",
-        #           64: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_64",
+        #           27: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_27>,
+        #           35: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_35>,
+        #           36: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_36_to_63>,
+        #           64: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_64>,
         #           ...
-        #           8192: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_8192_to_max",
+        #           8192: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_8192_to_max>,
         #       }
         #   }
-        cxi_base_path = Path("/sys/class/cxi")
+        cxi_base_path = "/sys/class/cxi"
         cxi_glob_pattern = "device/telemetry/hni_*_ok*"
-        cxi_re_pattern = "hni_(tx|rx)_ok_(\d+)[_to]*(\d+)?"
         cxi_data_paths = {
             "rx": self.__cxi_rx_data_paths,
             "tx": self.__cxi_tx_data_paths,
         }
 
         cxi_nics = []
-        if cxi_base_path.is_dir():
-            cxi_nics = cxi_base_path.iterdir()
+        if os.path.isdir(cxi_base_path):
+            with os.scandir(cxi_base_path) as entries:
+                cxi_nics = [entry for entry in entries if entry.is_dir()]
 
-        for nic in cxi_nics:
-            if not nic.is_dir():
-                continue
-
-            nic_name = nic.name
+        for nic_entry in cxi_nics:
+            nic = nic_entry.path
+            nic_name = nic_entry.name
             self.__cxi_rx_data_paths[nic_name] = {}
             self.__cxi_tx_data_paths[nic_name] = {}
 
-            for bucket in nic.glob(cxi_glob_pattern):
-                match = re.match(cxi_re_pattern, bucket.name)
+            for bucket in glob.glob(os.path.join(nic, cxi_glob_pattern)):
+                match = utils.CXI_BUCKET_PATTERN.fullmatch(os.path.basename(bucket))
                 if not match:
                     continue
 
+                counter = utils.open_sysfs_counter(bucket)
+                if counter is None:
+                    continue
+
                 kind = match.group(1)
                 min_size = int(match.group(2))
-                cxi_data_paths[kind][nic_name][min_size] = bucket
+                cxi_data_paths[kind][nic_name][min_size] = counter
 
-        # Infiniband traffic (/sys/class/infiniband): store data paths to
-        # counters, indexed by interface ID and port ID. For example, for Rx
-        # bandwidth:
+        # Infiniband traffic (/sys/class/infiniband): store open counters,
+        # indexed by interface ID and port ID. For example, for Rx bandwidth:
         #   __infiniband_rx_data_paths = {
-        #       "mlx5_0:1": "/sys/class/infiniband/mlx5_0/ports/1/counters/port_rcv_data",
-        #       "mlx5_1:1": "/sys/class/infiniband/mlx5_1/ports/1/counters/port_rcv_data",
+        #       "mlx5_0:1": <counter for /sys/class/infiniband/mlx5_0/ports/1/counters/port_rcv_data>,
+        #       "mlx5_1:1": <counter for /sys/class/infiniband/mlx5_1/ports/1/counters/port_rcv_data>,
         #       }
         #   }
-        ib_base_path = Path("/sys/class/infiniband")
+        ib_base_path = "/sys/class/infiniband"
 
         ib_nics = []
-        if ib_base_path.is_dir():
-            ib_nics = ib_base_path.iterdir()
+        if os.path.isdir(ib_base_path):
+            with os.scandir(ib_base_path) as entries:
+                ib_nics = [entry for entry in entries if entry.is_dir()]
 
         for nic in ib_nics:
-            if not nic.is_dir():
-                continue
+            with os.scandir(os.path.join(nic.path, "ports")) as entries:
+                ports = list(entries)
 
-            ports = nic / "ports"
-            for port in ports.iterdir():
-                nic_name = f"{nic.name}:{port.name}"
+            for port_entry in ports:
+                port = port_entry.path
+                nic_name = f"{nic.name}:{port_entry.name}"
 
-                rx_path = port / "counters" / "port_rcv_data"
-                if rx_path.is_file() and rx_path.stat().st_size > 0:
-                    self.__ib_rx_data_paths[nic_name] = rx_path
+                rx_path = os.path.join(port, "counters", "port_rcv_data")
+                if self.__is_nonempty_file(rx_path):
+                    rx_counter = utils.open_sysfs_counter(rx_path)
+                    if rx_counter is not None:
+                        self.__ib_rx_data_paths[nic_name] = rx_counter
 
-                tx_path = port / "counters" / "port_xmit_data"
-                if tx_path.is_file() and tx_path.stat().st_size > 0:
-                    self.__ib_tx_data_paths[nic_name] = tx_path
+                tx_path = os.path.join(port, "counters", "port_xmit_data")
+                if self.__is_nonempty_file(tx_path):
+                    tx_counter = utils.open_sysfs_counter(tx_path)
+                    if tx_counter is not None:
+                        self.__ib_tx_data_paths[nic_name] = tx_counter
 
         # Register Prometheus metrics for Rx and Tx. Devices are identified by
         # device class and interface name. For example, the Prometheus metric
@@ -187,59 +216,50 @@ class NETWORK(Collector):
             self.__tx_metric = Gauge(metric, description, labelnames=labels)
             logging.info(f"--> [registered] {metric} -> {description} (gauge)")
 
-    def updateMetrics(self):
-        """Update registered metrics of interest"""
-
-        net_data = [
-            (self.__net_rx_data_paths, self.__rx_metric),
-            (self.__net_tx_data_paths, self.__tx_metric),
+        # Pair each counter with its gauge child for the matching device class
+        # and interface; updateMetrics() never looks up labels.
+        data_paths = [
+            (self.__rx_metric, self.__net_rx_data_paths, self.__cxi_rx_data_paths, self.__ib_rx_data_paths),
+            (self.__tx_metric, self.__net_tx_data_paths, self.__cxi_tx_data_paths, self.__ib_tx_data_paths),
         ]
+        for metric, net_paths, cxi_paths, ib_paths in data_paths:
+            if metric is None:
+                continue
+            for nic, counter in net_paths.items():
+                self.__net_counters.append((counter, metric.labels(device_class="net", interface=nic)))
+            for nic, buckets in cxi_paths.items():
+                self.__cxi_counters.append((buckets, metric.labels(device_class="cxi", interface=nic)))
+            for nic, counter in ib_paths.items():
+                self.__ib_counters.append((counter, metric.labels(device_class="infiniband", interface=nic)))
 
-        for data_paths, metric in net_data:
-            for nic, path in data_paths.items():
-                try:
-                    with open(path, "r") as f:
-                        data = int(f.read().strip())
-                        metric.labels(device_class="net", interface=nic).set(data)
-                except:
-                    pass
+    def updateMetrics(self):
+        """Update registered metrics of interest"""
 
-        cxi_data = [
-            (self.__cxi_rx_data_paths, self.__rx_metric),
-            (self.__cxi_tx_data_paths, self.__tx_metric),
-        ]
+        for counter, child in self.__net_counters:
+            try:
+                child.set(counter.read())
+            except (OSError, ValueError):
+                pass
 
         # For CXI, estimate lower bound of the total amount of bytes:
         # aggregate values from all buckets using the minimum packet size of
         # each bucket.
-        for data_paths, metric in cxi_data:
-            for nic, buckets in data_paths.items():
-                total = 0
-                for size, path in buckets.items():
-                    try:
-                        with open(path, "r") as f:
-                            data = f.read().strip()
-                            fields = data.split("@")
-                            count = int(fields[0])
-                            total += count * size
-                    except:
-                        pass
-                metric.labels(device_class="cxi", interface=nic).set(total)
-
-        ib_data = [
-            (self.__ib_rx_data_paths, self.__rx_metric),
-            (self.__ib_tx_data_paths, self.__tx_metric),
-        ]
-
-        for data_paths, metric in ib_data:
-            for nic, path in data_paths.items():
+        for buckets, child in self.__cxi_counters:
+            total = 0
+            for size, counter in buckets.items():
                 try:
-                    with open(path, "r") as f:
-                        data = int(f.read().strip())
-                        # Counters for infiniband are reported as "octets divided by 4";
-                        # multiply to collect the expected value in bytes.
-                        metric.labels(device_class="infiniband", interface=nic).set(data * 4)
-                except:
+                    count = counter.read()
+                    total += count * size
+                except (OSError, ValueError):
                     pass
+            child.set(total)
+
+        for counter, child in self.__ib_counters:
+            try:
+                # Counters for infiniband are reported as "octets divided by 4";
+                # multiply to collect the expected value in bytes.
+                child.set(counter.read() * 4)
+            except (OSError, ValueError):
+                pass
 
         return
@@ -27,14 +27,14 @@
 Implements a prometheus info metric to track additional CXI specific network data.
 """
 
+import concurrent.futures
 import configparser
 import logging
 import os
 import platform
-import re
 import sys
 import time
-from pathlib import Path
+from collections import defaultdict
 from typing import Optional
 
 from prometheus_client import Gauge
@@ -42,6 +42,78 @@ from prometheus_client import Gauge
 import omnistat.utils as utils
 from omnistat.collector_base import Collector
 
+CXI_BASE_PATH = "/sys/class/cxi"
+
+# Direct octet counters, by direction.
+CXI_OK_OCTETS_COUNTERS = {
+    "hni_sts_tx_ok_octets": "tx",
+    "hni_sts_rx_ok_octets": "rx",
+}
+
+# Flat counters with no indexing (rate can be derived in Prometheus), mapped
+# to their metric suffix.
+CXI_SIMPLE_COUNTERS = {
+    "hni_sts_tx_octets_multi": "tx_octets_multi",
+    "hni_sts_tx_octets_ieee": "tx_octets_ieee",
+    "hni_sts_tx_octets_opt": "tx_octets_opt",
+    "hni_sts_tx_bad_octets": "tx_bad_octets",
+    "hni_sts_rx_bad_octets": "rx_bad_octets",
+    "hni_pause_sent": "pause_sent",
+    "hni_fgfc_discard": "fgfc_discard",
+    "hni_pcs_corrected_cw": "pcs_corrected_cw",
+    "hni_pcs_uncorrected_cw": "pcs_uncorrected_cw",
+}
+
+# Traffic-class indexed counters (0..7), mapped to their metric suffix and
+# traffic class.
+CXI_TC_COUNTERS = {
+    f"{prefix}{tc}": (suffix, str(tc))
+    for suffix, prefix in [
+        ("pkts_sent_by_tc", "hni_pkts_sent_by_tc_"),
+        ("pkts_recv_by_tc", "hni_pkts_recv_by_tc_"),
+        ("pause_recv", "hni_pause_recv_"),
+        ("pause_xoff_sent", "hni_pause_xoff_sent_"),
+        ("discard_cntr", "hni_discard_cntr_"),
+    ]
+    for tc in range(8)
+}
+
+# Any Cassini telemetry counter referenced in features.tex is expected to exist
+# on target systems. Export them generically as raw counters to keep the
+# collector maintainable (derived metrics can be built in Prometheus).
+#
+# Exclude the histogram bucket counters already exported via
+# `*_ok_packets_bucket`.
+CXI_FEATURE_COUNTERS = frozenset(
+    {
+        "cq_cq_oxe_num_flits",
+        "cq_cq_oxe_num_idles",
+        "cq_cq_oxe_num_stalls",
+        "cq_sts_credits_in_use_lpe_cmd_credits",
+        "cq_sts_credits_in_use_lpe_rcv_fifo_credits",
+        "oxe_channel_idle",
+        "oxe_ioi_pkts_ordered",
+        "oxe_ioi_pkts_unordered",
+        "parbs_sts_credits_in_use_tarb_pi_posted_credits",
+        "pct_prf_tct_status_max_tct_in_use",
+        "pct_prf_tct_status_tct_in_use",
+        "pct_req_ordered",
+        "pct_req_unordered",
+        "pct_resource_busy",
+        "pct_sct_timeouts",
+        "pct_tct_timeouts",
+        "pct_trs_replay_pend_drops",
+    }
+)
+CXI_FEATURE_COUNTER_PREFIXES = (
+    "cq_cycles_blocked_",
+    "ixe_tc_req_ecn_pkts_",
+    "ixe_tc_req_no_ecn_pkts_",
+    "ixe_tc_rsp_ecn_pkts_",
+    "ixe_tc_rsp_no_ecn_pkts_",
+    "pct_req_rsp_latency_",
+)
+
 
 class NETWORK_CXI(Collector):
     def __init__(self, config: configparser.ConfigParser):
@@ -57,8 +129,9 @@ class NETWORK_CXI(Collector):
         self.__derived_metrics = config["omnistat.collectors.network_cxi"].getboolean(
             "enable_derived_metrics", fallback=False
         )
-        self.__rx_metric = None
-        self.__tx_metric = None
+        self.__num_read_threads = max(
+            1, config["omnistat.collectors.network_cxi"].getint("num_read_threads", fallback=1)
+        )
 
         # Files to check for for slingshot (CXI) devices.
         self.__cxi_rx_data_paths = {}
@@ -66,7 +139,8 @@ class NETWORK_CXI(Collector):
         self.__cxi_bucket_max_sizes = {"rx": {}, "tx": {}}
 
         # Additional CXI telemetry counters.
-        # Maps counter group -> interface -> (optional) index -> sysfs path.
+        # Maps counter group -> interface -> (optional) index -> sysfs
+        # counter.
         self.__cxi_ok_octets_paths = {"rx": {}, "tx": {}}
         self.__cxi_simple_counter_paths = {}
         self.__cxi_tc_counter_paths = {}
@@ -77,35 +151,38 @@ class NETWORK_CXI(Collector):
         self.__cxi_tc_gauges = {}
         self.__cxi_bucket_gauges = {"rx": None, "tx": None}
         self.__cxi_feature_counter_gauge = None
+        self.__cxi_raw_counters = []
+        self.__cxi_raw_counter_chunks = []
+        self.__read_pool = None
         self.__cxi_derived_gauges = {}
+        self.__cxi_derived_children = {}
+        self.__cxi_derived_nics = []
+        self.__cxi_latency_bins = {}
         self.__cxi_prev_samples = {}
 
-    @staticmethod
-    def __read_sysfs_counter(path: Path) -> int:
-        """Read a sysfs counter value.
+        # Counters that failed to read, to log each failure only once.
+        self.__warned_sysfs_counters = set()
 
-        Some CXI telemetry entries expose values as "<count>@<timestamp>".
-        """
-        with open(path, "r") as f:
-            value = f.read().strip()
-        if "@" in value:
-            value = value.split("@", 1)[0].strip()
-        return int(value)
+        # Counter values read during the current scrape, indexed by counter,
+        # so derived metrics reuse the raw counter reads.
+        self.__scrape_values = {}
 
-    def __read_sysfs_counter_maybe_warn(self, path: Path) -> int:
+    def __read_sysfs_counter_maybe_warn(self, counter: utils.SysfsCounter) -> int:
         try:
-            return self.__read_sysfs_counter(path)
-        except Exception as e:
-            if path not in self.__warned_sysfs_read_paths:
-                self.__warned_sysfs_read_paths.add(path)
-                logging.debug(f"NETWORK: failed reading sysfs counter {path}: {e}")
+            return counter.read()
+        except (OSError, ValueError) as e:
+            if counter not in self.__warned_sysfs_counters:
+                self.__warned_sysfs_counters.add(counter)
+                logging.debug("NETWORK: failed reading sysfs counter %s: %s", counter.path, e)
             raise
 
-    @staticmethod
-    def __safe_delta(current: int, previous: int) -> int:
-        # Treat counter resets/wraps as a delta of 0 for derived metrics.
-        delta = current - previous
-        return delta if delta >= 0 else 0
+    def __read_scrape_counter(self, counter: utils.SysfsCounter) -> int:
+        """Read a sysfs counter at most once per scrape."""
+        value = self.__scrape_values.get(counter)
+        if value is None:
+            value = self.__read_sysfs_counter_maybe_warn(counter)
+            self.__scrape_values[counter] = value
+        return value
 
     def __register_cxi_derived_metric(self, name: str, description: str):
         metric = self.__prefix + "cxi_" + name
@@ -118,23 +195,23 @@ class NETWORK_CXI(Collector):
         found = False
         paths = self.__cxi_feature_counter_paths.get(nic, {})
         for i in range(count):
-            path = paths.get(f"{prefix}{i}")
-            if path is None:
+            counter = paths.get(f"{prefix}{i}")
+            if counter is None:
                 continue
             try:
-                total += self.__read_sysfs_counter_maybe_warn(path)
+                total += self.__read_scrape_counter(counter)
                 found = True
-            except:
+            except (OSError, ValueError):
                 pass
         return total if found else None
 
     def __read_cxi_named(self, nic: str, name: str) -> Optional[int]:
-        path = self.__cxi_feature_counter_paths.get(nic, {}).get(name)
-        if path is None:
+        counter = self.__cxi_feature_counter_paths.get(nic, {}).get(name)
+        if counter is None:
             return None
         try:
-            return self.__read_sysfs_counter_maybe_warn(path)
-        except:
+            return self.__read_scrape_counter(counter)
+        except (OSError, ValueError):
             return None
 
     def __read_cxi_telemetry(self, nic: str, filename: str) -> Optional[int]:
@@ -156,176 +233,134 @@ class NETWORK_CXI(Collector):
         if suffix is None:
             return None
 
-        path = self.__cxi_simple_counter_paths.get(suffix, {}).get(nic)
-        if path is None:
+        counter = self.__cxi_simple_counter_paths.get(suffix, {}).get(nic)
+        if counter is None:
             return None
         try:
-            return self.__read_sysfs_counter_maybe_warn(path)
-        except:
+            return self.__read_scrape_counter(counter)
+        except (OSError, ValueError):
             return None
 
     def __read_cxi_tc_sum(self, suffix: str, nic: str) -> Optional[int]:
         total = 0
         found = False
-        for path in self.__cxi_tc_counter_paths.get(suffix, {}).get(nic, {}).values():
+        for counter in self.__cxi_tc_counter_paths.get(suffix, {}).get(nic, {}).values():
             try:
-                total += self.__read_sysfs_counter_maybe_warn(path)
+                total += self.__read_scrape_counter(counter)
                 found = True
-            except:
+            except (OSError, ValueError):
                 pass
         return total if found else None
 
     def __read_cxi_bucket_count(self, kind: str, nic: str, bucket_min: int) -> Optional[int]:
         buckets = self.__cxi_rx_data_paths.get(nic, {}) if kind == "rx" else self.__cxi_tx_data_paths.get(nic, {})
-        path = buckets.get(bucket_min)
-        if path is None:
+        counter = buckets.get(bucket_min)
+        if counter is None:
             return None
         try:
-            return self.__read_sysfs_counter_maybe_warn(path)
-        except:
+            return self.__read_scrape_counter(counter)
+        except (OSError, ValueError):
             return None
 
+    def __update_raw_counters(self, counters: list):
+        for counter, child in counters:
+            try:
+                value = self.__read_sysfs_counter_maybe_warn(counter)
+            except (OSError, ValueError):
+                continue
+            self.__scrape_values[counter] = value
+            child.set(value)
+
     def registerMetrics(self):
         """Register metrics of interest"""
 
-        # Slingshot CXI traffic (/sys/class/cxi): store data paths to binned
-        # telemetry files, indexed by interface ID and minimum size of the
-        # bucket. For example, for Rx bandwidth:
+        # Slingshot CXI traffic (/sys/class/cxi): store open counters for
+        # binned telemetry files, indexed by interface ID and minimum size of
+        # the bucket. For example, for Rx bandwidth:
         #   __cxi_rx_data_paths = {
         #       "cxi0": {
-        #           27: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_27",
-        #           35: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_35",
-        #           36: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_36_to_63",
-        #           64: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_64",
+        #           27: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_27>,
+        #           35: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_35>,
+        #           36: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_36_to_63>,
+        #           64: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_64>,
         #           ...
-        #           8192: "/sys/class/cxi/cx0/device/telemetry/hni_rx_ok_8192_to_max",
+        #           8192: <counter for /sys/class/cxi/cx0/device/telemetry/hni_rx_ok_8192_to_max>,
         #       }
         #   }
-        cxi_base_path = Path("/sys/class/cxi")
-        cxi_glob_pattern = "device/telemetry/hni_*_ok*"
-        cxi_re_pattern = r"^hni_(tx|rx)_ok_(\d+)(?:_to_(\d+|max))?$"
         cxi_data_paths = {
             "rx": self.__cxi_rx_data_paths,
             "tx": self.__cxi_tx_data_paths,
         }
 
+        # Interfaces are symlinks to their device directories; DirEntry.is_dir()
+        # follows them, and is_file() for telemetry entries comes from readdir.
         cxi_nics = []
-        if cxi_base_path.is_dir():
-            cxi_nics = cxi_base_path.iterdir()
+        if os.path.isdir(CXI_BASE_PATH):
+            with os.scandir(CXI_BASE_PATH) as entries:
+                cxi_nics = [entry for entry in entries if entry.is_dir()]
 
-        for nic in cxi_nics:
-            if not nic.is_dir():
-                continue
-
-            nic_name = nic.name
+        for nic_entry in cxi_nics:
+            nic = nic_entry.path
+            nic_name = nic_entry.name
             self.__cxi_rx_data_paths[nic_name] = {}
             self.__cxi_tx_data_paths[nic_name] = {}
             self.__cxi_bucket_max_sizes["rx"][nic_name] = {}
             self.__cxi_bucket_max_sizes["tx"][nic_name] = {}
 
-            for bucket in nic.glob(cxi_glob_pattern):
-                match = re.match(cxi_re_pattern, bucket.name)
-                if not match:
-                    continue
-
-                kind = match.group(1)
-                min_size = int(match.group(2))
-                cxi_data_paths[kind][nic_name][min_size] = bucket
-                max_size = match.group(3)
-                self.__cxi_bucket_max_sizes[kind][nic_name][min_size] = max_size or str(min_size)
-
-            # Optional: ingest additional Cassini telemetry counters if present.
-            telemetry_dir = nic / "device" / "telemetry"
-            if telemetry_dir.is_dir():
-                # Any counter referenced in features.tex is expected to exist on
-                # target systems. Export them generically as raw counters to
-                # keep the collector maintainable (derived metrics can be built
-                # in Prometheus).
-                #
-                # Exclude the histogram bucket counters already exported via
-                # `*_ok_packets_bucket`.
-                feature_exact = {
-                    "cq_cq_oxe_num_flits",
-                    "cq_cq_oxe_num_idles",
-                    "cq_cq_oxe_num_stalls",
-                    "cq_sts_credits_in_use_lpe_cmd_credits",
-                    "cq_sts_credits_in_use_lpe_rcv_fifo_credits",
-                    "oxe_channel_idle",
-                    "oxe_ioi_pkts_ordered",
-                    "oxe_ioi_pkts_unordered",
-                    "parbs_sts_credits_in_use_tarb_pi_posted_credits",
-                    "pct_prf_tct_status_max_tct_in_use",
-                    "pct_prf_tct_status_tct_in_use",
-                    "pct_req_ordered",
-                    "pct_req_unordered",
-                    "pct_resource_busy",
-                    "pct_sct_timeouts",
-                    "pct_tct_timeouts",
-                    "pct_trs_replay_pend_drops",
-                }
-                feature_prefixes = (
-                    "cq_cycles_blocked_",
-                    "ixe_tc_req_ecn_pkts_",
-                    "ixe_tc_req_no_ecn_pkts_",
-                    "ixe_tc_rsp_ecn_pkts_",
-                    "ixe_tc_rsp_no_ecn_pkts_",
-                    "pct_req_rsp_latency_",
-                )
-
-                for entry in telemetry_dir.iterdir():
-                    if not entry.is_file():
-                        continue
-
-                    name = entry.name
-                    if name.startswith("hni_rx_ok_") or name.startswith("hni_tx_ok_"):
-                        continue
-
-                    if name in feature_exact or name.startswith(feature_prefixes):
-                        self.__cxi_feature_counter_paths.setdefault(nic_name, {})[name] = entry
-
-                # Direct octet counters (preferred over bucket-based estimate).
-                for kind, filename in [
-                    ("tx", "hni_sts_tx_ok_octets"),
-                    ("rx", "hni_sts_rx_ok_octets"),
-                ]:
-                    path = telemetry_dir / filename
-                    if path.is_file():
-                        self.__cxi_ok_octets_paths[kind][nic_name] = path
-                        # Also export as a raw counter metric for dashboards.
-                        self.__cxi_simple_counter_paths.setdefault(f"{kind}_ok_octets", {})[nic_name] = path
-
-                # Flat counters with no indexing (rate can be derived in Prometheus).
-                simple_counters = {
-                    "tx_octets_multi": "hni_sts_tx_octets_multi",
-                    "tx_octets_ieee": "hni_sts_tx_octets_ieee",
-                    "tx_octets_opt": "hni_sts_tx_octets_opt",
-                    "tx_bad_octets": "hni_sts_tx_bad_octets",
-                    "rx_bad_octets": "hni_sts_rx_bad_octets",
-                    "pause_sent": "hni_pause_sent",
-                    "fgfc_discard": "hni_fgfc_discard",
-                    "pcs_corrected_cw": "hni_pcs_corrected_cw",
-                    "pcs_uncorrected_cw": "hni_pcs_uncorrected_cw",
-                }
-                for suffix, filename in simple_counters.items():
-                    path = telemetry_dir / filename
-                    if path.is_file():
-                        self.__cxi_simple_counter_paths.setdefault(suffix, {})[nic_name] = path
-
-                # Traffic-class indexed counters (0..7).
-                tc_counters = {
-                    "pkts_sent_by_tc": "hni_pkts_sent_by_tc_{}",
-                    "pkts_recv_by_tc": "hni_pkts_recv_by_tc_{}",
-                    "pause_recv": "hni_pause_recv_{}",
-                    "pause_xoff_sent": "hni_pause_xoff_sent_{}",
-                    "discard_cntr": "hni_discard_cntr_{}",
-                }
-                for suffix, pattern in tc_counters.items():
-                    for tc in range(8):
-                        path = telemetry_dir / pattern.format(tc)
-                        if path.is_file():
-                            self.__cxi_tc_counter_paths.setdefault(suffix, {}).setdefault(nic_name, {})[str(tc)] = path
+            # Classify every telemetry entry in a single directory pass.
+            telemetry_dir = os.path.join(nic, "device", "telemetry")
+            if os.path.isdir(telemetry_dir):
+                with os.scandir(telemetry_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+
+                        name = entry.name
+                        if name.startswith(("hni_rx_ok_", "hni_tx_ok_")):
+                            match = utils.CXI_BUCKET_PATTERN.fullmatch(name)
+                            if not match:
+                                continue
+
+                            counter = utils.open_sysfs_counter(entry.path)
+                            if counter is None:
+                                continue
+
+                            kind = match.group(1)
+                            min_size = int(match.group(2))
+                            cxi_data_paths[kind][nic_name][min_size] = counter
+                            max_size = match.group(3)
+                            self.__cxi_bucket_max_sizes[kind][nic_name][min_size] = max_size or str(min_size)
+
+                        elif name in CXI_OK_OCTETS_COUNTERS:
+                            # Direct octet counters (preferred over bucket-based estimate).
+                            counter = utils.open_sysfs_counter(entry.path)
+                            if counter is not None:
+                                kind = CXI_OK_OCTETS_COUNTERS[name]
+                                self.__cxi_ok_octets_paths[kind][nic_name] = counter
+                                # Also export as a raw counter metric for dashboards.
+                                self.__cxi_simple_counter_paths.setdefault(f"{kind}_ok_octets", {})[nic_name] = counter
+
+                        elif name in CXI_SIMPLE_COUNTERS:
+                            counter = utils.open_sysfs_counter(entry.path)
+                            if counter is not None:
+                                suffix = CXI_SIMPLE_COUNTERS[name]
+                                self.__cxi_simple_counter_paths.setdefault(suffix, {})[nic_name] = counter
+
+                        elif name in CXI_TC_COUNTERS:
+                            counter = utils.open_sysfs_counter(entry.path)
+                            if counter is not None:
+                                suffix, tc = CXI_TC_COUNTERS[name]
+                                self.__cxi_tc_counter_paths.setdefault(suffix, {}).setdefault(nic_name, {})[
+                                    tc
+                                ] = counter
+
+                        elif name in CXI_FEATURE_COUNTERS or name.startswith(CXI_FEATURE_COUNTER_PREFIXES):
+                            # Optional: ingest additional Cassini telemetry counters if present.
+                            counter = utils.open_sysfs_counter(entry.path)
+                            if counter is not None:
+                                self.__cxi_feature_counter_paths.setdefault(nic_name, {})[name] = counter
             else:
-                logging.debug(f"NETWORK: CXI telemetry dir missing: {telemetry_dir}")
+                logging.debug("NETWORK: CXI telemetry dir missing: %s", telemetry_dir)
 
             logging.debug(
                 "NETWORK: CXI %s discovered: rx_buckets=%d tx_buckets=%d ok_octets(rx=%s,tx=%s) simple=%d tc=%d feature=%d",
@@ -373,6 +408,46 @@ class NETWORK_CXI(Collector):
             self.__cxi_feature_counter_gauge = Gauge(metric, description, labelnames=["interface", "counter"])
             logging.info(f"--> [registered] {metric} -> {description} (gauge)")
 
+        # Resolve the labelled child of every raw counter once, so scrapes only
+        # read and set values.
+        for kind, data_paths in [("rx", self.__cxi_rx_data_paths), ("tx", self.__cxi_tx_data_paths)]:
+            gauge = self.__cxi_bucket_gauges[kind]
+            if gauge is None:
+                continue
+            for nic, buckets in data_paths.items():
+                for min_size, counter in buckets.items():
+                    max_size = self.__cxi_bucket_max_sizes[kind][nic][min_size]
+                    child = gauge.labels(interface=nic, bucket_min=str(min_size), bucket_max=str(max_size))
+                    self.__cxi_raw_counters.append((counter, child))
+
+        for suffix, per_nic in self.__cxi_simple_counter_paths.items():
+            gauge = self.__cxi_simple_gauges[suffix]
+            for nic, counter in per_nic.items():
+                self.__cxi_raw_counters.append((counter, gauge.labels(interface=nic)))
+
+        for suffix, per_nic in self.__cxi_tc_counter_paths.items():
+            gauge = self.__cxi_tc_gauges[suffix]
+            for nic, per_tc in per_nic.items():
+                for tc, counter in per_tc.items():
+                    self.__cxi_raw_counters.append((counter, gauge.labels(interface=nic, traffic_class=tc)))
+
+        gauge = self.__cxi_feature_counter_gauge
+        if gauge is not None:
+            for nic, counters in self.__cxi_feature_counter_paths.items():
+                for name, counter in counters.items():
+                    self.__cxi_raw_counters.append((counter, gauge.labels(interface=nic, counter=name)))
+
+        # Optionally spread raw counter reads across a small pool of threads;
+        # the GIL is released while the driver services each sysfs read.
+        if self.__num_read_threads > 1 and len(self.__cxi_raw_counters) > 0:
+            counters = self.__cxi_raw_counters
+            chunk_size = -(-len(counters) // self.__num_read_threads)
+            self.__cxi_raw_counter_chunks = [counters[i : i + chunk_size] for i in range(0, len(counters), chunk_size)]
+            self.__read_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(self.__cxi_raw_counter_chunks), thread_name_prefix="CXI counter reader"
+            )
+            logging.info("NETWORK: reading CXI counters with %d threads", len(self.__cxi_raw_counter_chunks))
+
         # Derived CXI metrics defined in features.tex (computed from deltas).
 
         if self.__derived_metrics:
@@ -468,103 +543,50 @@ class NETWORK_CXI(Collector):
                     "ecc_uncorrected_cw_per_second", "CXI ECC uncorrected codeword rate (cw/s)"
                 )
 
+                # Interfaces and latency histogram bins (pct_req_rsp_latency_<i>)
+                # used by derived metrics don't change after discovery. Skip
+                # interfaces without any of the source counters, which would
+                # only ever report zeros.
+                cxi_nics = set()
+                cxi_nics |= set(self.__cxi_ok_octets_paths["rx"].keys())
+                cxi_nics |= set(self.__cxi_ok_octets_paths["tx"].keys())
+                cxi_nics |= {nic for nic, buckets in self.__cxi_tx_data_paths.items() if buckets}
+                cxi_nics |= set(self.__cxi_feature_counter_paths.keys())
+                cxi_nics |= {nic for d in self.__cxi_simple_counter_paths.values() for nic in d.keys()}
+                cxi_nics |= {nic for d in self.__cxi_tc_counter_paths.values() for nic in d.keys()}
+                self.__cxi_derived_nics = sorted(cxi_nics)
+
+                for nic in self.__cxi_derived_nics:
+                    latency_bins = {}
+                    for name, counter in self.__cxi_feature_counter_paths.get(nic, {}).items():
+                        if not name.startswith("pct_req_rsp_latency_"):
+                            continue
+                        suffix = name[len("pct_req_rsp_latency_") :]
+                        if not suffix.isdigit():
+                            continue
+                        index = int(suffix)
+                        latency_bins[index] = (f"pct_req_rsp_latency_{index}", counter)
+                    self.__cxi_latency_bins[nic] = [(index, *latency_bins[index]) for index in sorted(latency_bins)]
+
     def updateMetrics(self):
         """Update registered metrics of interest"""
 
-        # CXI counters.
-        # Prefer exact fabric octet counters if available; otherwise, estimate a
-        # lower bound from the message-size histogram buckets.
-        for kind, metric in [("rx", self.__rx_metric), ("tx", self.__tx_metric)]:
-            for nic in (
-                set(self.__cxi_rx_data_paths.keys())
-                | set(self.__cxi_tx_data_paths.keys())
-                | set(self.__cxi_ok_octets_paths[kind].keys())
-            ):
-                total = None
-                path = self.__cxi_ok_octets_paths[kind].get(nic)
-                if path is not None:
-                    try:
-                        total = self.__read_sysfs_counter_maybe_warn(path)
-                    except:
-                        total = None
-
-                if total is None:
-                    buckets = (
-                        self.__cxi_rx_data_paths.get(nic, {}) if kind == "rx" else self.__cxi_tx_data_paths.get(nic, {})
-                    )
-                    total = 0
-                    for size, bucket_path in buckets.items():
-                        try:
-                            count = self.__read_sysfs_counter_maybe_warn(bucket_path)
-                            total += count * size
-                        except:
-                            pass
-
-                if metric is not None:
-                    metric.labels(device_class="cxi", interface=nic).set(total)
-
-        # Export CXI packet counts for each size bucket.
-        for kind, data_paths in [("rx", self.__cxi_rx_data_paths), ("tx", self.__cxi_tx_data_paths)]:
-            gauge = self.__cxi_bucket_gauges.get(kind)
-            if gauge is None:
-                continue
-            for nic, buckets in data_paths.items():
-                for min_size, bucket_path in buckets.items():
-                    try:
-                        count = self.__read_sysfs_counter_maybe_warn(bucket_path)
-                        max_size = self.__cxi_bucket_max_sizes[kind].get(nic, {}).get(min_size, str(min_size))
-                        gauge.labels(interface=nic, bucket_min=str(min_size), bucket_max=str(max_size)).set(count)
-                    except:
-                        pass
-
-        # Export additional CXI telemetry counters as raw values.
-        for suffix, per_nic in self.__cxi_simple_counter_paths.items():
-            gauge = self.__cxi_simple_gauges.get(suffix)
-            if gauge is None:
-                continue
-            for nic, path in per_nic.items():
-                try:
-                    value = self.__read_sysfs_counter_maybe_warn(path)
-                    gauge.labels(interface=nic).set(value)
-                except:
-                    pass
-
-        for suffix, per_nic in self.__cxi_tc_counter_paths.items():
-            gauge = self.__cxi_tc_gauges.get(suffix)
-            if gauge is None:
-                continue
-            for nic, per_tc in per_nic.items():
-                for tc, path in per_tc.items():
-                    try:
-                        value = self.__read_sysfs_counter_maybe_warn(path)
-                        gauge.labels(interface=nic, traffic_class=tc).set(value)
-                    except:
-                        pass
+        self.__scrape_values.clear()
 
-        gauge = self.__cxi_feature_counter_gauge
-        if gauge is not None:
-            for nic, counters in self.__cxi_feature_counter_paths.items():
-                for name, path in counters.items():
-                    try:
-                        value = self.__read_sysfs_counter_maybe_warn(path)
-                        gauge.labels(interface=nic, counter=name).set(value)
-                    except:
-                        pass
+        # Export CXI packet counts for each size bucket and additional CXI
+        # telemetry counters as raw values.
+        if self.__read_pool is None:
+            self.__update_raw_counters(self.__cxi_raw_counters)
+        else:
+            list(self.__read_pool.map(self.__update_raw_counters, self.__cxi_raw_counter_chunks))
 
         # Derived CXI metrics (features.tex). These are computed per interface
         # from deltas between successive samples.
-        if len(self.__cxi_derived_gauges) > 0:
+        if len(self.__cxi_derived_nics) > 0:
             now = time.monotonic()
             eps = 1e-9
 
-            cxi_nics = set()
-            cxi_nics |= set(self.__cxi_ok_octets_paths["rx"].keys())
-            cxi_nics |= set(self.__cxi_ok_octets_paths["tx"].keys())
-            cxi_nics |= set(self.__cxi_tx_data_paths.keys())
-            cxi_nics |= set(self.__cxi_feature_counter_paths.keys())
-            cxi_nics |= {nic for d in self.__cxi_tc_counter_paths.values() for nic in d.keys()}
-
-            for nic in cxi_nics:
+            for nic in self.__cxi_derived_nics:
                 # Gather current raw counters needed by formulas.
                 current = {}
 
@@ -624,190 +646,142 @@ class NETWORK_CXI(Collector):
                     put(f"hni_tx_ok_bucket_{bucket_min}", self.__read_cxi_bucket_count("tx", nic, bucket_min))
 
                 # Latency histogram: pct_req_rsp_latency_<i>
-                latency_bins = {}
-                for name, path in self.__cxi_feature_counter_paths.get(nic, {}).items():
-                    if not name.startswith("pct_req_rsp_latency_"):
-                        continue
-                    suffix = name[len("pct_req_rsp_latency_") :]
-                    if not suffix.isdigit():
-                        continue
+                for _, name, counter in self.__cxi_latency_bins[nic]:
                     try:
-                        latency_bins[int(suffix)] = self.__read_sysfs_counter_maybe_warn(path)
-                    except:
+                        current[name] = self.__read_scrape_counter(counter)
+                    except (OSError, ValueError):
                         pass
-                for idx, value in latency_bins.items():
-                    current[f"pct_req_rsp_latency_{idx}"] = value
 
                 prev = self.__cxi_prev_samples.get(nic)
+                self.__cxi_prev_samples[nic] = (now, current)
                 if prev is None:
-                    self.__cxi_prev_samples[nic] = {"ts": now, "values": current}
                     continue
 
-                dt = now - prev["ts"]
+                prev_ts, prev_values = prev
+                dt = now - prev_ts
                 if dt <= 0:
-                    self.__cxi_prev_samples[nic] = {"ts": now, "values": current}
                     continue
 
-                prev_values = prev["values"]
+                # Labelled children are resolved on the first derived sample
+                # of each interface and reused afterwards.
+                children = self.__cxi_derived_children.get(nic)
+                if children is None:
+                    children = {name: gauge.labels(interface=nic) for name, gauge in self.__cxi_derived_gauges.items()}
+                    self.__cxi_derived_children[nic] = children
 
-                def d(name: str) -> int:
-                    if name not in current or name not in prev_values:
-                        return 0
-                    return self.__safe_delta(current[name], prev_values[name])
+                # Compute every delta once. Counters missing from either sample
+                # count as 0, and so do counter resets/wraps.
+                deltas = defaultdict(int)
+                for name, value in current.items():
+                    previous = prev_values.get(name)
+                    if previous is not None and value > previous:
+                        deltas[name] = value - previous
 
-                delta_tx_ok = d("hni_sts_tx_ok_octets")
-                delta_rx_ok = d("hni_sts_rx_ok_octets")
+                delta_tx_ok = deltas["hni_sts_tx_ok_octets"]
+                delta_rx_ok = deltas["hni_sts_rx_ok_octets"]
 
                 tx_bw = delta_tx_ok / dt if delta_tx_ok else 0.0
                 rx_bw = delta_rx_ok / dt if delta_rx_ok else 0.0
-                self.__cxi_derived_gauges["tx_bandwidth_bytes_per_second"].labels(interface=nic).set(tx_bw)
-                self.__cxi_derived_gauges["rx_bandwidth_bytes_per_second"].labels(interface=nic).set(rx_bw)
-                self.__cxi_derived_gauges["bidirectional_bandwidth_bytes_per_second"].labels(interface=nic).set(
-                    (delta_tx_ok + delta_rx_ok) / dt
-                )
-                self.__cxi_derived_gauges["tx_to_rx_balance_ratio"].labels(interface=nic).set(tx_bw / max(rx_bw, eps))
-
-                self.__cxi_derived_gauges["multicast_tx_share_fraction"].labels(interface=nic).set(
-                    d("hni_sts_tx_octets_multi") / max(delta_tx_ok, 1)
-                )
-                self.__cxi_derived_gauges["ieee_tx_share_fraction"].labels(interface=nic).set(
-                    d("hni_sts_tx_octets_ieee") / max(delta_tx_ok, 1)
-                )
-                self.__cxi_derived_gauges["optimized_tx_share_fraction"].labels(interface=nic).set(
-                    d("hni_sts_tx_octets_opt") / max(delta_tx_ok, 1)
-                )
-
-                delta_pkts_tx = d("hni_pkts_sent_by_tc_sum")
-                delta_pkts_rx = d("hni_pkts_recv_by_tc_sum")
-                self.__cxi_derived_gauges["packet_send_rate_packets_per_second"].labels(interface=nic).set(
-                    delta_pkts_tx / dt
-                )
-                self.__cxi_derived_gauges["packet_receive_rate_packets_per_second"].labels(interface=nic).set(
-                    delta_pkts_rx / dt
-                )
-                self.__cxi_derived_gauges["avg_bytes_per_tx_packet"].labels(interface=nic).set(
-                    delta_tx_ok / max(delta_pkts_tx, 1)
-                )
-
-                delta_small_pkts = sum(d(f"hni_tx_ok_bucket_{m}") for m in [64, 65, 128])
-                delta_large_pkts = sum(d(f"hni_tx_ok_bucket_{m}") for m in [1024, 2048, 4096, 8192])
-                self.__cxi_derived_gauges["small_packet_fraction_tx"].labels(interface=nic).set(
-                    delta_small_pkts / max(delta_pkts_tx, 1)
-                )
-                self.__cxi_derived_gauges["large_packet_fraction_tx"].labels(interface=nic).set(
-                    delta_large_pkts / max(delta_pkts_tx, 1)
-                )
-
-                delta_flits = d("cq_cq_oxe_num_flits")
-                delta_idles = d("cq_cq_oxe_num_idles")
-                self.__cxi_derived_gauges["link_busy_fraction"].labels(interface=nic).set(
-                    delta_flits / max(delta_flits + delta_idles, 1)
-                )
-                self.__cxi_derived_gauges["link_stall_per_flit"].labels(interface=nic).set(
-                    d("cq_cq_oxe_num_stalls") / max(delta_flits, 1)
-                )
-                self.__cxi_derived_gauges["cq_blocked_cycles_per_second"].labels(interface=nic).set(
-                    d("cq_cycles_blocked_sum") / dt
-                )
-                self.__cxi_derived_gauges["nic_no_work_cycles_per_second"].labels(interface=nic).set(
-                    d("oxe_channel_idle") / dt
-                )
-
-                self.__cxi_derived_gauges["pause_received_per_second"].labels(interface=nic).set(
-                    d("hni_pause_recv_sum") / dt
-                )
-                self.__cxi_derived_gauges["pause_sent_per_second"].labels(interface=nic).set(d("hni_pause_sent") / dt)
-                self.__cxi_derived_gauges["xoff_sent_per_second"].labels(interface=nic).set(
-                    d("hni_pause_xoff_sent_sum") / dt
-                )
-
-                delta_req_ecn = d("ixe_tc_req_ecn_pkts_sum")
-                delta_req_no = d("ixe_tc_req_no_ecn_pkts_sum")
-                delta_rsp_ecn = d("ixe_tc_rsp_ecn_pkts_sum")
-                delta_rsp_no = d("ixe_tc_rsp_no_ecn_pkts_sum")
-                self.__cxi_derived_gauges["ecn_marking_ratio_request_fraction"].labels(interface=nic).set(
-                    delta_req_ecn / max(delta_req_ecn + delta_req_no, 1)
-                )
-                self.__cxi_derived_gauges["ecn_marking_ratio_response_fraction"].labels(interface=nic).set(
+                children["tx_bandwidth_bytes_per_second"].set(tx_bw)
+                children["rx_bandwidth_bytes_per_second"].set(rx_bw)
+                children["bidirectional_bandwidth_bytes_per_second"].set((delta_tx_ok + delta_rx_ok) / dt)
+                children["tx_to_rx_balance_ratio"].set(tx_bw / max(rx_bw, eps))
+
+                children["multicast_tx_share_fraction"].set(deltas["hni_sts_tx_octets_multi"] / max(delta_tx_ok, 1))
+                children["ieee_tx_share_fraction"].set(deltas["hni_sts_tx_octets_ieee"] / max(delta_tx_ok, 1))
+                children["optimized_tx_share_fraction"].set(deltas["hni_sts_tx_octets_opt"] / max(delta_tx_ok, 1))
+
+                delta_pkts_tx = deltas["hni_pkts_sent_by_tc_sum"]
+                delta_pkts_rx = deltas["hni_pkts_recv_by_tc_sum"]
+                children["packet_send_rate_packets_per_second"].set(delta_pkts_tx / dt)
+                children["packet_receive_rate_packets_per_second"].set(delta_pkts_rx / dt)
+                children["avg_bytes_per_tx_packet"].set(delta_tx_ok / max(delta_pkts_tx, 1))
+
+                delta_small_pkts = sum(deltas[f"hni_tx_ok_bucket_{m}"] for m in [64, 65, 128])
+                delta_large_pkts = sum(deltas[f"hni_tx_ok_bucket_{m}"] for m in [1024, 2048, 4096, 8192])
+                children["small_packet_fraction_tx"].set(delta_small_pkts / max(delta_pkts_tx, 1))
+                children["large_packet_fraction_tx"].set(delta_large_pkts / max(delta_pkts_tx, 1))
+
+                delta_flits = deltas["cq_cq_oxe_num_flits"]
+                delta_idles = deltas["cq_cq_oxe_num_idles"]
+                children["link_busy_fraction"].set(delta_flits / max(delta_flits + delta_idles, 1))
+                children["link_stall_per_flit"].set(deltas["cq_cq_oxe_num_stalls"] / max(delta_flits, 1))
+                children["cq_blocked_cycles_per_second"].set(deltas["cq_cycles_blocked_sum"] / dt)
+                children["nic_no_work_cycles_per_second"].set(deltas["oxe_channel_idle"] / dt)
+
+                children["pause_received_per_second"].set(deltas["hni_pause_recv_sum"] / dt)
+                children["pause_sent_per_second"].set(deltas["hni_pause_sent"] / dt)
+                children["xoff_sent_per_second"].set(deltas["hni_pause_xoff_sent_sum"] / dt)
+
+                delta_req_ecn = deltas["ixe_tc_req_ecn_pkts_sum"]
+                delta_req_no = deltas["ixe_tc_req_no_ecn_pkts_sum"]
+                delta_rsp_ecn = deltas["ixe_tc_rsp_ecn_pkts_sum"]
+                delta_rsp_no = deltas["ixe_tc_rsp_no_ecn_pkts_sum"]
+                children["ecn_marking_ratio_request_fraction"].set(delta_req_ecn / max(delta_req_ecn + delta_req_no, 1))
+                children["ecn_marking_ratio_response_fraction"].set(
                     delta_rsp_ecn / max(delta_rsp_ecn + delta_rsp_no, 1)
                 )
-                self.__cxi_derived_gauges["congestion_discard_per_second"].labels(interface=nic).set(
-                    (d("hni_discard_cntr_sum") + d("hni_fgfc_discard")) / dt
+                children["congestion_discard_per_second"].set(
+                    (deltas["hni_discard_cntr_sum"] + deltas["hni_fgfc_discard"]) / dt
                 )
 
-                self.__cxi_derived_gauges["command_credits_in_use_per_second"].labels(interface=nic).set(
-                    d("cq_sts_credits_in_use_lpe_cmd_credits") / dt
-                )
-                self.__cxi_derived_gauges["receive_fifo_credits_in_use_per_second"].labels(interface=nic).set(
-                    d("cq_sts_credits_in_use_lpe_rcv_fifo_credits") / dt
-                )
-                self.__cxi_derived_gauges["pi_posted_credits_in_use_per_second"].labels(interface=nic).set(
-                    d("parbs_sts_credits_in_use_tarb_pi_posted_credits") / dt
+                children["command_credits_in_use_per_second"].set(deltas["cq_sts_credits_in_use_lpe_cmd_credits"] / dt)
+                children["receive_fifo_credits_in_use_per_second"].set(
+                    deltas["cq_sts_credits_in_use_lpe_rcv_fifo_credits"] / dt
                 )
-                self.__cxi_derived_gauges["resource_busy_per_second"].labels(interface=nic).set(
-                    d("pct_resource_busy") / dt
+                children["pi_posted_credits_in_use_per_second"].set(
+                    deltas["parbs_sts_credits_in_use_tarb_pi_posted_credits"] / dt
                 )
-                self.__cxi_derived_gauges["endpoint_table_pressure_fraction"].labels(interface=nic).set(
-                    d("pct_prf_tct_status_tct_in_use") / max(d("pct_prf_tct_status_max_tct_in_use"), 1)
+                children["resource_busy_per_second"].set(deltas["pct_resource_busy"] / dt)
+                children["endpoint_table_pressure_fraction"].set(
+                    deltas["pct_prf_tct_status_tct_in_use"] / max(deltas["pct_prf_tct_status_max_tct_in_use"], 1)
                 )
 
-                self.__cxi_derived_gauges["ordered_to_unordered_ratio"].labels(interface=nic).set(
-                    d("oxe_ioi_pkts_ordered") / max(d("oxe_ioi_pkts_unordered"), 1)
-                )
-                ordered = d("oxe_ioi_pkts_ordered")
-                unordered = d("oxe_ioi_pkts_unordered")
-                self.__cxi_derived_gauges["unordered_fraction"].labels(interface=nic).set(
-                    unordered / max(ordered + unordered, 1)
+                children["ordered_to_unordered_ratio"].set(
+                    deltas["oxe_ioi_pkts_ordered"] / max(deltas["oxe_ioi_pkts_unordered"], 1)
                 )
+                ordered = deltas["oxe_ioi_pkts_ordered"]
+                unordered = deltas["oxe_ioi_pkts_unordered"]
+                children["unordered_fraction"].set(unordered / max(ordered + unordered, 1))
 
-                delta_req_ordered = d("pct_req_ordered")
-                delta_req_unordered = d("pct_req_unordered")
-                self.__cxi_derived_gauges["ordered_request_fraction"].labels(interface=nic).set(
+                delta_req_ordered = deltas["pct_req_ordered"]
+                delta_req_unordered = deltas["pct_req_unordered"]
+                children["ordered_request_fraction"].set(
                     delta_req_ordered / max(delta_req_ordered + delta_req_unordered, 1)
                 )
 
                 # Latency proxies (bin index based): use the numeric suffix as
                 # bin center index, since bin centers are platform-defined.
-                latency_deltas = []
-                for key in current.keys():
-                    if not key.startswith("pct_req_rsp_latency_"):
-                        continue
-                    suffix = key[len("pct_req_rsp_latency_") :]
-                    if not suffix.isdigit() or key not in prev_values:
-                        continue
-                    latency_deltas.append((int(suffix), self.__safe_delta(current[key], prev_values[key])))
-                latency_deltas = [(idx, cnt) for idx, cnt in latency_deltas if cnt > 0]
-                latency_deltas.sort(key=lambda x: x[0])
-                total_latency = sum(cnt for _, cnt in latency_deltas)
+                # Bins are already sorted by index; accumulate the totals while
+                # collecting the non-empty bins.
+                latency_counts = []
+                total_latency = 0
+                weighted_latency = 0
+                for idx, name, _ in self.__cxi_latency_bins[nic]:
+                    cnt = deltas[name]
+                    if cnt > 0:
+                        latency_counts.append(cnt)
+                        total_latency += cnt
+                        weighted_latency += idx * cnt
                 if total_latency > 0:
-                    mean_idx = sum(idx * cnt for idx, cnt in latency_deltas) / total_latency
-                    num_bins = len(latency_deltas)
+                    mean_idx = weighted_latency / total_latency
+                    num_bins = len(latency_counts)
                     top_n = max(1, int(round(num_bins * 0.10)))
-                    tail_cnt = sum(cnt for _, cnt in latency_deltas[-top_n:])
+                    tail_cnt = sum(latency_counts[-top_n:])
                     tail_frac = tail_cnt / total_latency
                 else:
                     mean_idx = 0.0
                     tail_frac = 0.0
-                self.__cxi_derived_gauges["mean_rsp_latency_bin_index"].labels(interface=nic).set(mean_idx)
-                self.__cxi_derived_gauges["tail_latency_fraction_top10pct_bins"].labels(interface=nic).set(tail_frac)
-
-                self.__cxi_derived_gauges["timeout_per_second"].labels(interface=nic).set(
-                    (d("pct_sct_timeouts") + d("pct_tct_timeouts") + d("pct_trs_replay_pend_drops")) / dt
-                )
+                children["mean_rsp_latency_bin_index"].set(mean_idx)
+                children["tail_latency_fraction_top10pct_bins"].set(tail_frac)
 
-                self.__cxi_derived_gauges["bad_tx_octets_per_second"].labels(interface=nic).set(
-                    d("hni_sts_tx_bad_octets") / dt
-                )
-                self.__cxi_derived_gauges["bad_rx_octets_per_second"].labels(interface=nic).set(
-                    d("hni_sts_rx_bad_octets") / dt
-                )
-                self.__cxi_derived_gauges["ecc_corrected_cw_per_second"].labels(interface=nic).set(
-                    d("hni_pcs_corrected_cw") / dt
-                )
-                self.__cxi_derived_gauges["ecc_uncorrected_cw_per_second"].labels(interface=nic).set(
-                    d("hni_pcs_uncorrected_cw") / dt
+                children["timeout_per_second"].set(
+                    (deltas["pct_sct_timeouts"] + deltas["pct_tct_timeouts"] + deltas["pct_trs_replay_pend_drops"]) / dt
                 )
 
-                self.__cxi_prev_samples[nic] = {"ts": now, "values": current}
+                children["bad_tx_octets_per_second"].set(deltas["hni_sts_tx_bad_octets"] / dt)
+                children["bad_rx_octets_per_second"].set(deltas["hni_sts_rx_bad_octets"] / dt)
+                children["ecc_corrected_cw_per_second"].set(deltas["hni_pcs_corrected_cw"] / dt)
+                children["ecc_uncorrected_cw_per_second"].set(deltas["hni_pcs_uncorrected_cw"] / dt)
 
         return
@@ -30,7 +30,6 @@
 
 import configparser
 import importlib.resources
-import json
 import logging
 import os
 import platform
@@ -132,14 +131,10 @@ class Monitor:
     def initMetrics(self):
 
         # Load collector definitions
-        _json_path = os.path.join(os.path.dirname(__file__), "collector_definitions.json")
-
         try:
-            with open(_json_path, "r") as f:
-                data = json.load(f)
-                COLLECTORS = data["collectors"]
+            COLLECTORS = utils.load_collector_definitions()["collectors"]
         except Exception as e:
-            logging.error(f"Failed to load collector definitions from file: {_json_path}: {e}")
+            logging.error(f"Failed to load collector definitions: {e}")
             sys.exit(1)
 
         for collector in COLLECTORS:
@@ -30,7 +30,6 @@
 import argparse
 import ctypes
 import importlib
-import json
 import logging
 import os
 import platform
@@ -165,13 +164,10 @@ class Standalone:
             sys.exit(1)
 
         # Load endpoint definitions
-        definitions_path = os.path.join(os.path.dirname(__file__), "collector_definitions.json")
         try:
-            with open(definitions_path, "r") as f:
-                data = json.load(f)
-                endpoints = data["endpoints"]
+            endpoints = utils.load_collector_definitions()["endpoints"]
         except Exception as e:
-            logging.error(f"Failed to load endpoint definitions from file: {definitions_path}: {e}")
+            logging.error(f"Failed to load endpoint definitions: {e}")
             sys.exit(1)
 
         self.__endpoints = []
@@ -25,7 +25,9 @@
 import argparse
 import concurrent.futures
 import configparser
+import errno
 import importlib.resources
+import json
 import logging
 import os
 import re
@@ -37,10 +39,27 @@ import sys
 import time
 from importlib.metadata import version
 from pathlib import Path
+from types import MappingProxyType
 
 # Global to store dynamically loaded amdsmi python module (shared across all collectors)
 _amdsmi_module = None
 
+# Global to store collector definitions (loaded once per process)
+_collector_definitions = None
+
+# Sysfs counters kept open across samples (shared across all collectors). At
+# most half of the soft RLIMIT_NOFILE is used for them; counters beyond that
+# budget open their file on every read.
+_sysfs_counter_fds = 0
+_sysfs_counter_budget_warned = False
+
+# Errors returned by open sysfs files whose device went away (e.g. after a
+# driver reload or interface re-creation).
+SYSFS_STALE_ERRNOS = (errno.ENODEV, errno.ESTALE)
+
+# CXI message-size histogram buckets, e.g. hni_rx_ok_64 or hni_tx_ok_8192_to_max.
+CXI_BUCKET_PATTERN = re.compile(r"hni_(tx|rx)_ok_(\d+)(?:_to_(\d+|max))?")
+
 
 def load_amdsmi_interface(rocm_path):
     """Dynamically load amdsmi Python module from ROCm installation.
@@ -107,6 +126,129 @@ def get_amdsmi_module():
     return _amdsmi_module
 
 
+def load_collector_definitions():
+    """Load collector and endpoint definitions used for dynamic loading.
+
+    Definitions are read from collector_definitions.json on first use and
+    cached as read-only entries for the lifetime of the process.
+
+    Returns:
+        dict: {"collectors": tuple, "endpoints": tuple} with one read-only mapping per definition
+    """
+    global _collector_definitions
+
+    if _collector_definitions is not None:
+        return _collector_definitions
+
+    definitions_path = os.path.join(os.path.dirname(__file__), "collector_definitions.json")
+    with open(definitions_path, "r") as f:
+        data = json.load(f)
+
+    _collector_definitions = {
+        "collectors": tuple(MappingProxyType(entry) for entry in data["collectors"]),
+        "endpoints": tuple(MappingProxyType(entry) for entry in data["endpoints"]),
+    }
+    return _collector_definitions
+
+
+class SysfsCounter:
+    """Integer counter exposed through a sysfs file.
+
+    The file is kept open and re-read from offset 0, which returns the current
+    value without a new open/close per sample. Counters created without a
+    file descriptor open their file on every read instead. Some entries, such
+    as CXI telemetry, expose values as "<count>@<timestamp>"; only the count is
+    returned.
+    """
+
+    def __init__(self, path, fd=None):
+        self.path = path
+        self.__fd = fd
+
+    def read(self):
+        """Read the current counter value.
+
+        Raises:
+            OSError: If the file can't be read.
+            ValueError: If the contents are not an integer.
+        """
+        if self.__fd is None:
+            fd = os.open(self.path, os.O_RDONLY)
+            try:
+                data = os.pread(fd, 64, 0)
+            finally:
+                os.close(fd)
+        else:
+            try:
+                data = os.pread(self.__fd, 64, 0)
+            except OSError as e:
+                if e.errno not in SYSFS_STALE_ERRNOS:
+                    raise
+                # Reopen by path; if the device isn't back yet, this raises and
+                # the stale descriptor is retried on the next read.
+                fd = os.open(self.path, os.O_RDONLY)
+                os.close(self.__fd)
+                self.__fd = fd
+                data = os.pread(fd, 64, 0)
+
+        end = data.find(b"@")
+        if end >= 0:
+            data = data[:end]
+        return int(data)
+
+    def close(self):
+        global _sysfs_counter_fds
+
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+            _sysfs_counter_fds -= 1
+
+
+def open_sysfs_counter(path):
+    """Open a sysfs counter for repeated reads.
+
+    The counter is read once to make sure it can be parsed, so callers only
+    ever see counters that were readable at discovery time. Once the file
+    descriptor budget for sysfs counters is used up, the counter reopens its
+    file on every read.
+
+    Args:
+        path (str): Path to the sysfs file.
+
+    Returns:
+        SysfsCounter: Counter, or None if it can't be opened or read.
+    """
+    global _sysfs_counter_fds, _sysfs_counter_budget_warned
+
+    soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft_limit == resource.RLIM_INFINITY or _sysfs_counter_fds < soft_limit // 2:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            logging.debug("failed opening sysfs counter %s: %s", path, e)
+            return None
+        _sysfs_counter_fds += 1
+        counter = SysfsCounter(path, fd)
+    else:
+        if not _sysfs_counter_budget_warned:
+            _sysfs_counter_budget_warned = True
+            logging.info(
+                "Holding %d sysfs counters open (open files limit = %d); remaining counters are reopened on every read",
+                _sysfs_counter_fds,
+                soft_limit,
+            )
+        counter = SysfsCounter(path)
+
+    try:
+        counter.read()
+    except (OSError, ValueError) as e:
+        logging.debug("failed reading sysfs counter %s: %s", path, e)
+        counter.close()
+        return None
+    return counter
+
+
 def convert_bdf_to_gpuid(bdf_string):
     """
     Converts BDF text string in hex format to a GPU location id in the form written by kfd driver
@@ -101,7 +101,7 @@ class TestPopBins:
         assert list(ts.keys()) == [3000]
 
     def test_empty_ts(self, collector_instance):
-        """pop_bins on an empty OrderedDict returns empty list without error."""
+        """pop_bins on an empty dict returns empty list without error."""
         collector_instance._KernelTrace__ts.clear()
         result = collector_instance._KernelTrace__pop_bins(9999)
         assert result == []
@@ -228,6 +228,25 @@ class TestProcessDispatches:
         # ts[3000] is unchanged
         assert ts[3000][key] == [1, 40]
 
+    def test_interleaved_bins_snapshot(self, collector_instance, mock_time):
+        """Each bin keeps the running totals as of its last dispatch in arrival order."""
+        dispatches = [
+            make_dispatch("0", "kernel_a", end_ns=s_to_ns(2.1), duration_ns=10),
+            make_dispatch("0", "kernel_a", end_ns=s_to_ns(2.2), duration_ns=20),
+            make_dispatch("0", "kernel_a", end_ns=s_to_ns(3.1), duration_ns=30),
+            make_dispatch("0", "kernel_a", end_ns=s_to_ns(2.3), duration_ns=40),
+        ]
+        collector_instance._KernelTrace__dispatches.extend(dispatches)
+
+        set_time(mock_time, 4)
+        collector_instance._KernelTrace__process_dispatches()
+
+        ts = collector_instance._KernelTrace__ts
+        key = ("0", "kernel_a")
+
+        assert ts[3000][key] == [4, 100]
+        assert ts[4000][key] == [3, 60]
+
     def test_multiple_kernels_multiple_gpus(self, collector_instance, mock_time):
         """4 dispatches across 2 GPUs and 2 kernels all go into the same bin."""
         dispatches = [
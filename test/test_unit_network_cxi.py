@@ -0,0 +1,67 @@
+import configparser
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from omnistat.contrib.collector_network_cxi import NETWORK_CXI
+
+DERIVED_PREFIX = "omnistat_network_cxi_"
+
+
+def write_counters(nic_dir, counters):
+    """Write CXI telemetry counter files for one interface."""
+    telemetry = nic_dir / "device" / "telemetry"
+    telemetry.mkdir(parents=True, exist_ok=True)
+    for name, value in counters.items():
+        (telemetry / name).write_text(f"{value}@1700000000.000000000\n")
+
+
+@pytest.fixture
+def cxi_root(tmp_path):
+    """Point the collector to a fake /sys/class/cxi tree."""
+    with patch("omnistat.contrib.collector_network_cxi.CXI_BASE_PATH", str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture
+def registry_cleanup():
+    """Unregister metrics created by the collector after each test."""
+    before = set(REGISTRY._collector_to_names)
+    yield
+    for collector in set(REGISTRY._collector_to_names) - before:
+        REGISTRY.unregister(collector)
+
+
+@pytest.fixture
+def collector(cxi_root, registry_cleanup):
+    config = configparser.ConfigParser()
+    config["omnistat.collectors.network_cxi"] = {"enable_derived_metrics": "True"}
+    return NETWORK_CXI(config)
+
+
+def derived_value(name, nic):
+    return REGISTRY.get_sample_value(DERIVED_PREFIX + name, {"interface": nic})
+
+
+class TestNetworkCXIDerivedMetrics:
+    def test_interface_with_only_simple_counters(self, cxi_root, collector):
+        write_counters(cxi_root / "cxi0", {"hni_sts_tx_ok_octets": 1000, "hni_sts_rx_ok_octets": 2000})
+        write_counters(cxi_root / "cxi1", {"hni_pause_sent": 10, "hni_pcs_corrected_cw": 100})
+        (cxi_root / "cxi2").mkdir()
+
+        with patch("time.monotonic", return_value=100.0):
+            collector.registerMetrics()
+            collector.updateMetrics()
+
+        write_counters(cxi_root / "cxi0", {"hni_sts_tx_ok_octets": 3500, "hni_sts_rx_ok_octets": 2000})
+        write_counters(cxi_root / "cxi1", {"hni_pause_sent": 20, "hni_pcs_corrected_cw": 150})
+        with patch("time.monotonic", return_value=102.5):
+            collector.updateMetrics()
+
+        assert derived_value("tx_bandwidth_bytes_per_second", "cxi0") == 1000.0
+        assert derived_value("pause_sent_per_second", "cxi1") == 4.0
+        assert derived_value("ecc_corrected_cw_per_second", "cxi1") == 20.0
+
+        # Interfaces without any telemetry counters don't report derived metrics
+        assert derived_value("ecc_corrected_cw_per_second", "cxi2") is None